@@ -5,10 +5,12 @@ Handles all database interactions with proper error handling and connection mana
 
 import sqlite3
 import os
+import threading
 from pathlib import Path
-from datetime import datetime
-from typing import Optional, List, Dict, Any, Tuple
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any, Tuple, Iterator
 from contextlib import contextmanager
+from functools import lru_cache
 import logging
 
 from .models import (
@@ -18,11 +20,19 @@ from .models import (
     Tag,
     Visit,
     BrowserSource,
-    URLFilter
+    URLFilter,
+    URLFilterSet
 )
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round trip when streaming an export
+EXPORT_BATCH_SIZE = 500
+
+# URLs looked up per query when upserting scanned links (stays well under
+# SQLite's bound-parameter limit)
+UPSERT_LOOKUP_BATCH_SIZE = 500
+
 
 class DatabaseManager:
     """Manages all database operations for the Link Tracker."""
@@ -46,10 +56,18 @@ class DatabaseManager:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Filter cache for performance
+        # Filter cache for performance. Scans match URLs on a worker thread
+        # while the filter dialog invalidates the cache on the Tk thread, so
+        # the filter set is swapped and cleared under a lock.
         self._filter_cache = None
         self._filter_cache_time = None
         self._filter_cache_ttl = 60  # Cache TTL in seconds
+        self._filter_lock = threading.Lock()
+        self._filter_generation = 0  # Bumped whenever the filter set changes
+
+        # Per-URL match results keyed by filter generation, so results
+        # computed from an older filter set are never reused
+        self._match_cache = lru_cache(maxsize=4096)(self._find_matching_filter_uncached)
 
         # Initialize database schema
         self._init_database()
@@ -287,6 +305,95 @@ class DatabaseManager:
             row = cursor.fetchone()
             return Link.from_row(row)
 
+    def upsert_links_batch(self, items: List[Tuple[str, Optional[str], Optional[datetime]]],
+                           browser: Optional[str] = None,
+                           browser_profile: Optional[str] = None) -> Tuple[int, int]:
+        """Insert or update many links in a single transaction.
+
+        Same rules as upsert_link(): deleted links are left untouched, and
+        last_accessed_at only moves forward. Items are applied in order, so a
+        URL that appears more than once is inserted once and then updated.
+
+        Args:
+            items: (url, title, visited_at) tuples; title and visited_at may be None
+            browser: Browser name (chrome/edge/etc)
+            browser_profile: Browser profile name
+
+        Returns:
+            Tuple of (new_count, updated_count)
+        """
+        if not items:
+            return 0, 0
+
+        new_count = 0
+        updated_count = 0
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+
+            # Look up existing links (including deleted ones) in chunks
+            urls = list({item[0] for item in items})
+            existing = {}
+            for i in range(0, len(urls), UPSERT_LOOKUP_BATCH_SIZE):
+                chunk = urls[i:i + UPSERT_LOOKUP_BATCH_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(
+                    f"SELECT id, url, is_deleted FROM links WHERE url IN ({placeholders})",
+                    chunk
+                )
+                for row in cursor.fetchall():
+                    existing[row['url']] = (row['id'], row['is_deleted'])
+
+            now = datetime.now().isoformat()
+            visits = []
+
+            for url, title, visited_at in items:
+                # Use provided visited_at time, or current time as fallback
+                visit_time = visited_at.isoformat() if visited_at else now
+
+                if url in existing:
+                    link_id, is_deleted = existing[url]
+
+                    # If link is deleted, don't update it
+                    if is_deleted:
+                        continue
+
+                    # Only move last_accessed_at forward
+                    cursor.execute("""
+                        UPDATE links
+                        SET title = COALESCE(?, title),
+                            last_accessed_at = CASE
+                                WHEN last_accessed_at IS NULL OR ? > last_accessed_at THEN ?
+                                ELSE last_accessed_at
+                            END,
+                            access_count = access_count + 1,
+                            updated_at = ?
+                        WHERE id = ?
+                    """, (title, visit_time, visit_time, now, link_id))
+                    updated_count += 1
+                else:
+                    cursor.execute("""
+                        INSERT INTO links (url, title, created_at, updated_at, last_accessed_at)
+                        VALUES (?, ?, ?, ?, ?)
+                    """, (url, title or url, now, now, visit_time))
+                    link_id = cursor.lastrowid
+                    existing[url] = (link_id, 0)
+                    new_count += 1
+
+                # Record visit if browser info provided
+                if browser:
+                    visits.append((link_id, browser, browser_profile, visit_time))
+
+            if visits:
+                cursor.executemany("""
+                    INSERT INTO visits (link_id, browser, browser_profile, visited_at)
+                    VALUES (?, ?, ?, ?)
+                """, visits)
+
+            conn.commit()
+
+        return new_count, updated_count
+
     def get_link(self, link_id: int) -> Optional[Link]:
         """Get a single link by ID."""
         with self.get_connection() as conn:
@@ -310,7 +417,8 @@ class DatabaseManager:
                   sort_desc: bool = True,
                   limit: Optional[int] = None,
                   offset: int = 0,
-                  include_deleted: bool = False) -> List[Link]:
+                  include_deleted: bool = False,
+                  after_id: Optional[int] = None) -> List[Link]:
         """Get filtered and sorted links.
 
         Args:
@@ -322,10 +430,17 @@ class DatabaseManager:
             sort_desc: Sort descending if True
             limit: Maximum results
             offset: Pagination offset
+            include_deleted: Include deleted links if True, or only them if 'only'
+            after_id: Return only links sorted after this link (keyset
+                pagination, used instead of offset for later pages)
 
         Returns:
             List of Link objects
         """
+        valid_sorts = ['last_accessed_at', 'access_count', 'created_at', 'title']
+        if sort_by not in valid_sorts:
+            sort_by = None
+
         with self.get_connection() as conn:
             # Ensure columns exist before running queries
             self._ensure_columns_exist(conn)
@@ -356,10 +471,11 @@ class DatabaseManager:
 
             # Time filter
             if days_back:
-                where_clauses.append(
-                    "l.last_accessed_at >= datetime('now', '-' || ? || ' days')"
-                )
-                params.append(days_back)
+                # Compute the cutoff once, in the same local ISO format the
+                # timestamps are stored in, so the comparison can use the index
+                cutoff = datetime.now() - timedelta(days=days_back)
+                where_clauses.append("l.last_accessed_at >= ?")
+                params.append(cutoff.isoformat())
 
             # Filter deleted links - optimized for index usage
             if not include_deleted:
@@ -367,15 +483,35 @@ class DatabaseManager:
             elif include_deleted == 'only':  # Special case for trash view
                 where_clauses.append("l.is_deleted = 1")
 
+            # Keyset pagination: continue after the anchor link's sort position.
+            # The anchor's stored value is compared, so formats always match.
+            if after_id is not None:
+                op = '<' if sort_desc else '>'
+                if not sort_by:
+                    where_clauses.append(f"l.id {op} ?")
+                    params.append(after_id)
+                else:
+                    anchor = conn.execute(
+                        f"SELECT {sort_by} FROM links WHERE id = ?", (after_id,)
+                    ).fetchone()
+                    if anchor is None:
+                        return []  # Anchor no longer exists
+                    where_clauses.append(self._keyset_clause(sort_by, op, anchor[0]))
+                    params.extend(
+                        [after_id] if anchor[0] is None else [anchor[0], anchor[0], after_id]
+                    )
+
             # Build WHERE clause
             if where_clauses:
                 query += " WHERE " + " AND ".join(where_clauses)
 
-            # Sorting
-            valid_sorts = ['last_accessed_at', 'access_count', 'created_at', 'title']
-            if sort_by in valid_sorts:
-                query += f" ORDER BY l.{sort_by}"
-                query += " DESC" if sort_desc else " ASC"
+            # Sorting; ties are broken by id in the same direction, so
+            # LIMIT/OFFSET and keyset pages never overlap
+            direction = " DESC" if sort_desc else " ASC"
+            if sort_by:
+                query += f" ORDER BY l.{sort_by}{direction}, l.id{direction}"
+            else:
+                query += f" ORDER BY l.id{direction}"
 
             # Pagination
             if limit:
@@ -392,48 +528,106 @@ class DatabaseManager:
                 return links
             
             # Batch load categories and tags to avoid N+1 query problem
-            link_ids = [link.id for link in links]
-            
-            # Load all categories for these links in one query
-            placeholders = ','.join('?' * len(link_ids))
-            cursor.execute(f"""
-                SELECT lc.link_id, c.* FROM categories c
-                JOIN link_categories lc ON c.id = lc.category_id
-                WHERE lc.link_id IN ({placeholders})
-                ORDER BY c.name
-            """, link_ids)
-            
-            # Group categories by link_id
-            categories_by_link = {}
-            for row in cursor.fetchall():
-                link_id = row['link_id']
-                if link_id not in categories_by_link:
-                    categories_by_link[link_id] = []
-                categories_by_link[link_id].append(Category.from_row(row))
-            
-            # Load all tags for these links in one query
-            cursor.execute(f"""
-                SELECT lt.link_id, t.* FROM tags t
-                JOIN link_tags lt ON t.id = lt.tag_id
-                WHERE lt.link_id IN ({placeholders})
-                ORDER BY t.name
-            """, link_ids)
-            
-            # Group tags by link_id
-            tags_by_link = {}
-            for row in cursor.fetchall():
-                link_id = row['link_id']
-                if link_id not in tags_by_link:
-                    tags_by_link[link_id] = []
-                tags_by_link[link_id].append(Tag.from_row(row))
-            
-            # Assign categories and tags to links
-            for link in links:
-                link.categories = categories_by_link.get(link.id, [])
-                link.tags = tags_by_link.get(link.id, [])
+            self._attach_relations(cursor, links)
 
             return links
 
+    @staticmethod
+    def _keyset_clause(sort_by: str, op: str, anchor_value) -> str:
+        """Build the WHERE term selecting rows sorted after an anchor row.
+
+        SQLite sorts NULL before every value, so NULLs come last in
+        descending order and first in ascending order.
+
+        Args:
+            sort_by: Sort column
+            op: '<' for descending order, '>' for ascending
+            anchor_value: The anchor row's sort value (may be None)
+
+        Returns:
+            SQL term; binds (after_id) for a NULL anchor value, otherwise
+            (anchor_value, anchor_value, after_id)
+        """
+        column = f"l.{sort_by}"
+        if anchor_value is None:
+            if op == '<':
+                # Only NULL rows remain after a NULL anchor
+                return f"({column} IS NULL AND l.id < ?)"
+            return f"({column} IS NOT NULL OR l.id > ?)"
+
+        # The first term gives SQLite an index range; the second breaks ties
+        after_anchor = f"({column} {op}= ? AND ({column} {op} ? OR l.id {op} ?))"
+        if op == '<':
+            return f"({after_anchor} OR {column} IS NULL)"
+        return after_anchor
+
+    def _attach_relations(self, cursor, links: List[Link]):
+        """Load categories and tags for a batch of links in two queries.
+
+        Args:
+            cursor: Cursor on an open connection
+            links: Links to populate (modified in place)
+        """
+        link_ids = [link.id for link in links]
+        
+        # Load all categories for these links in one query
+        placeholders = ','.join('?' * len(link_ids))
+        cursor.execute(f"""
+            SELECT lc.link_id, c.* FROM categories c
+            JOIN link_categories lc ON c.id = lc.category_id
+            WHERE lc.link_id IN ({placeholders})
+            ORDER BY c.name
+        """, link_ids)
+        
+        # Group categories by link_id
+        categories_by_link = {}
+        for row in cursor.fetchall():
+            link_id = row['link_id']
+            if link_id not in categories_by_link:
+                categories_by_link[link_id] = []
+            categories_by_link[link_id].append(Category.from_row(row))
+        
+        # Load all tags for these links in one query
+        cursor.execute(f"""
+            SELECT lt.link_id, t.* FROM tags t
+            JOIN link_tags lt ON t.id = lt.tag_id
+            WHERE lt.link_id IN ({placeholders})
+            ORDER BY t.name
+        """, link_ids)
+        
+        # Group tags by link_id
+        tags_by_link = {}
+        for row in cursor.fetchall():
+            link_id = row['link_id']
+            if link_id not in tags_by_link:
+                tags_by_link[link_id] = []
+            tags_by_link[link_id].append(Tag.from_row(row))
+        
+        # Assign categories and tags to links
+        for link in links:
+            link.categories = categories_by_link.get(link.id, [])
+            link.tags = tags_by_link.get(link.id, [])
+
+    def count_deleted_links(self, search_query: Optional[str] = None) -> int:
+        """Count links in the recycle bin.
+
+        Args:
+            search_query: Only count links whose URL, title or notes match
+
+        Returns:
+            Number of deleted links
+        """
+        query = "SELECT COUNT(*) FROM links WHERE is_deleted = 1"
+        params = []
+        if search_query:
+            query += " AND (url LIKE ? OR title LIKE ? OR notes LIKE ?)"
+            search_pattern = f"%{search_query}%"
+            params.extend([search_pattern, search_pattern, search_pattern])
+
+        with self.get_connection() as conn:
+            self._ensure_columns_exist(conn)
+            return conn.execute(query, params).fetchone()[0]
+
     def update_link(self, link_id: int, title: Optional[str] = None,
                    notes: Optional[str] = None, is_favorite: Optional[bool] = None) -> bool:
         """Update link properties."""
@@ -889,14 +1083,18 @@ class DatabaseManager:
 
     def export_to_dict(self) -> Dict[str, Any]:
         """Export all data to a dictionary."""
-        links = self.get_links(limit=None, include_deleted=False)  # Don't export deleted links
+        data = self.export_metadata()
+        data['links'] = list(self.iter_export_links())  # Don't export deleted links
+        return data
+
+    def export_metadata(self) -> Dict[str, Any]:
+        """Export everything except links (version info, categories, tags)."""
         categories = self.get_categories()
         tags = self.get_tags()
 
         return {
             'version': '1.0',
             'exported_at': datetime.now().isoformat(),
-            'links': [link.to_dict() for link in links],
             'categories': [
                 {
                     'name': cat.name,
@@ -908,6 +1106,40 @@ class DatabaseManager:
             'tags': [tag.name for tag in tags]
         }
 
+    def iter_export_links(self, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+        """Yield export dictionaries for all non-deleted links, one batch at a time.
+
+        Only one batch of rows is held in memory, so large databases can be
+        streamed to disk without building the whole export first.
+
+        Args:
+            batch_size: Number of link rows fetched per round trip
+
+        Yields:
+            Link dictionaries in the same format as export_to_dict
+        """
+        with self.get_connection() as conn:
+            self._ensure_columns_exist(conn)
+
+            link_cursor = conn.cursor()
+            link_cursor.execute("""
+                SELECT * FROM links
+                WHERE is_deleted = 0 OR is_deleted IS NULL
+                ORDER BY last_accessed_at DESC
+            """)
+
+            # Separate cursor for relations so the link cursor keeps its position
+            relation_cursor = conn.cursor()
+            while True:
+                rows = link_cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+
+                links = [Link.from_row(row) for row in rows]
+                self._attach_relations(relation_cursor, links)
+                for link in links:
+                    yield link.to_dict()
+
     def import_from_dict(self, data: Dict[str, Any]) -> Dict[str, int]:
         """Import data from a dictionary.
 
@@ -1094,6 +1326,9 @@ class DatabaseManager:
             conn.commit()
             filter_id = cursor.lastrowid
 
+            # Invalidate filter cache
+            self.invalidate_filter_cache()
+
             # Fetch and return the created filter
             cursor.execute("SELECT * FROM url_filters WHERE id = ?", (filter_id,))
             return URLFilter.from_row(cursor.fetchone())
@@ -1175,7 +1410,7 @@ class DatabaseManager:
             conn.commit()
 
             # Invalidate filter cache
-            self._filter_cache = None
+            self.invalidate_filter_cache()
 
             return cursor.rowcount > 0
 
@@ -1192,8 +1427,52 @@ class DatabaseManager:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM url_filters WHERE id = ?", (filter_id,))
             conn.commit()
+
+            # Invalidate filter cache
+            self.invalidate_filter_cache()
+
             return cursor.rowcount > 0
 
+    def find_matching_filter(self, url: str) -> Optional[URLFilter]:
+        """Find the first active filter that matches a URL.
+
+        Args:
+            url: The URL to check
+
+        Returns:
+            The matching URLFilter, or None if no active filter matches
+        """
+        filter_set, generation = self._current_filter_set()
+        return self._match_cache(generation, url, filter_set)
+
+    def _current_filter_set(self) -> Tuple[URLFilterSet, int]:
+        """Get the active filter set and its generation, reloading it when stale."""
+        with self._filter_lock:
+            now = datetime.now()
+            if (self._filter_cache is None or
+                self._filter_cache_time is None or
+                (now - self._filter_cache_time).total_seconds() > self._filter_cache_ttl):
+                self._filter_cache = URLFilterSet(self.get_filters(active_only=True))
+                self._filter_cache_time = now
+                self._filter_generation += 1
+                self._match_cache.cache_clear()
+            return self._filter_cache, self._filter_generation
+
+    def _find_matching_filter_uncached(self, generation: int, url: str,
+                                       filter_set: URLFilterSet) -> Optional[URLFilter]:
+        """Match a URL against a filter set (memoized by _match_cache).
+
+        The generation is unused here; it is part of the memoization key.
+        """
+        return filter_set.find_match(url)
+
+    def invalidate_filter_cache(self):
+        """Drop cached filters and match results after filters change."""
+        with self._filter_lock:
+            self._filter_cache = None
+            self._filter_generation += 1
+            self._match_cache.cache_clear()
+
     def should_track_url(self, url: str) -> bool:
         """Check if a URL should be tracked (not filtered out).
 
@@ -1203,19 +1482,10 @@ class DatabaseManager:
         Returns:
             True if the URL should be tracked, False if it should be filtered out
         """
-        # Use cached filters for performance
-        now = datetime.now()
-        if (self._filter_cache is None or 
-            self._filter_cache_time is None or
-            (now - self._filter_cache_time).total_seconds() > self._filter_cache_ttl):
-            self._filter_cache = self.get_filters(active_only=True)
-            self._filter_cache_time = now
-
-        # Check if URL matches any cached filter
-        for url_filter in self._filter_cache:
-            if url_filter.matches(url):
-                logger.debug(f"URL {url} filtered by pattern: {url_filter.pattern}")
-                return False  # URL is filtered, don't track
+        url_filter = self.find_matching_filter(url)
+        if url_filter:
+            logger.debug(f"URL {url} filtered by pattern: {url_filter.pattern}")
+            return False  # URL is filtered, don't track
 
         return True  # URL is not filtered, track it
 
@@ -3,9 +3,11 @@ Database models and schema definitions for the Browser Link Tracker.
 Using raw SQLite for minimal dependencies.
 """
 
+import re
 import sqlite3
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from urllib.parse import urlparse
+from typing import Optional, List, Dict, Any, FrozenSet, Tuple
 
 # SQL schema definitions
 SCHEMA_SQL = """
@@ -142,6 +144,40 @@ class Link:
         self.categories: List[Category] = []
         self.tags: List[Tag] = []
 
+    @property
+    def categories(self) -> List['Category']:
+        """Categories assigned to this link."""
+        return self._categories
+
+    @categories.setter
+    def categories(self, value: List['Category']):
+        self._categories = value
+        self._category_id_set = None
+
+    @property
+    def tags(self) -> List['Tag']:
+        """Tags assigned to this link."""
+        return self._tags
+
+    @tags.setter
+    def tags(self, value: List['Tag']):
+        self._tags = value
+        self._tag_name_set = None
+
+    @property
+    def category_id_set(self) -> FrozenSet[int]:
+        """IDs of this link's categories, cached until categories are reassigned."""
+        if self._category_id_set is None:
+            self._category_id_set = frozenset(cat.id for cat in self._categories)
+        return self._category_id_set
+
+    @property
+    def tag_name_set(self) -> FrozenSet[str]:
+        """Names of this link's tags, cached until tags are reassigned."""
+        if self._tag_name_set is None:
+            self._tag_name_set = frozenset(tag.name for tag in self._tags)
+        return self._tag_name_set
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON export."""
         return {
@@ -238,6 +274,10 @@ class URLFilter:
         self.created_at = created_at or datetime.now()
         self.updated_at = updated_at or datetime.now()
 
+        # Compiled regex, rebuilt only when the pattern changes
+        self._regex = None
+        self._regex_source = None
+
     @staticmethod
     def from_row(row: sqlite3.Row) -> 'URLFilter':
         """Create URLFilter from database row."""
@@ -253,11 +293,18 @@ class URLFilter:
             updated_at=datetime.fromisoformat(row['updated_at']) if row['updated_at'] else None
         )
 
+    def _get_regex(self) -> Optional['re.Pattern']:
+        """Get the compiled regex for this pattern, or None if it is invalid."""
+        if self._regex_source != self.pattern:
+            try:
+                self._regex = re.compile(self.pattern, re.IGNORECASE)
+            except re.error:
+                self._regex = None
+            self._regex_source = self.pattern
+        return self._regex
+
     def matches(self, url: str) -> bool:
         """Check if the URL matches this filter pattern."""
-        import re
-        from urllib.parse import urlparse
-
         if not self.is_active:
             return False
 
@@ -278,14 +325,74 @@ class URLFilter:
 
         elif self.filter_type == 'regex':
             # Match with regular expression
-            try:
-                return bool(re.match(self.pattern, url, re.IGNORECASE))
-            except re.error:
-                return False
+            regex = self._get_regex()
+            return bool(regex and regex.match(url))
 
         return False
 
 
+class URLFilterSet:
+    """Active URL filters indexed by type for fast matching.
+
+    Domain filters are looked up in a dict by host suffix and prefix filters
+    are checked with a single str.startswith call, so only 'contains' and
+    'regex' filters are tested one by one. Each entry keeps the filter's
+    position in the original list, so the first matching filter in that
+    order is returned, as when testing every filter in turn.
+    """
+
+    def __init__(self, filters: List[URLFilter]):
+        self.domain_filters: Dict[str, Tuple[int, URLFilter]] = {}
+        self.prefix_filters: Dict[str, Tuple[int, URLFilter]] = {}
+        self.other_filters: List[Tuple[int, URLFilter]] = []
+
+        for index, url_filter in enumerate(filters):
+            if not url_filter.is_active:
+                continue
+            entry = (index, url_filter)
+            if url_filter.filter_type == 'domain':
+                self.domain_filters.setdefault(url_filter.pattern.lower(), entry)
+            elif url_filter.filter_type == 'prefix':
+                self.prefix_filters.setdefault(url_filter.pattern.lower(), entry)
+            else:
+                self.other_filters.append(entry)
+
+        self._prefixes = tuple(self.prefix_filters)
+
+    def find_match(self, url: str) -> Optional[URLFilter]:
+        """Find the first active filter that matches the URL, or None."""
+        best = None
+
+        if self.domain_filters:
+            # Check the domain and each parent domain (a.b.com, b.com, com)
+            domain = urlparse(url).netloc.lower()
+            while True:
+                entry = self.domain_filters.get(domain)
+                if entry and (best is None or entry[0] < best[0]):
+                    best = entry
+                dot = domain.find('.')
+                if dot < 0:
+                    break
+                domain = domain[dot + 1:]
+
+        if self._prefixes:
+            url_lower = url.lower()
+            if url_lower.startswith(self._prefixes):
+                for prefix, entry in self.prefix_filters.items():
+                    if url_lower.startswith(prefix) and (best is None or entry[0] < best[0]):
+                        best = entry
+
+        # Only filters listed before the best match so far can replace it
+        for entry in self.other_filters:
+            if best is not None and entry[0] > best[0]:
+                break
+            if entry[1].matches(url):
+                best = entry
+                break
+
+        return best[1] if best else None
+
+
 class Tag:
     """Represents a tag for labeling links."""
 
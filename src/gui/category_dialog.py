@@ -2,6 +2,8 @@
 Category management dialog.
 """
 
+import bisect
+import re
 import tkinter as tk
 from tkinter import ttk, messagebox, colorchooser
 from typing import List
@@ -9,6 +11,21 @@ from typing import List
 from database.db_manager import DatabaseManager
 from database.models import Category
 
+HEX_COLOR_PATTERN = re.compile(r'#[0-9A-Fa-f]{6}')
+DEFAULT_ITEM_COLOR = '#000000'
+
+
+def _sanitize_color(color: str) -> str:
+    """Return the color if it is a valid #RRGGBB string, else the default."""
+    if color and HEX_COLOR_PATTERN.fullmatch(color):
+        return color
+    return DEFAULT_ITEM_COLOR
+
+
+def _category_sort_key(category: Category) -> tuple:
+    """Sort key matching get_categories() (sort_order, then name)."""
+    return (category.sort_order or 0, category.name)
+
 
 class CategoryDialog:
     """Dialog for managing categories."""
@@ -24,24 +41,26 @@ class CategoryDialog:
         self.categories = []
         self.selected_category = None
 
-        # Create dialog window
+        # Create dialog window (hidden until positioned to avoid a flash)
         self.dialog = tk.Toplevel(parent)
+        self.dialog.withdraw()
         self.dialog.title("Manage Categories")
-        self.dialog.geometry("600x450")
         self.dialog.resizable(True, True)
-
-        # Make modal
         self.dialog.transient(parent)
-        self.dialog.grab_set()
 
         self._build_ui()
         self._load_categories()
 
-        # Center the dialog
+        # Center the dialog with a single geometry call
+        width, height = 600, 450
         self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (self.dialog.winfo_width() // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (self.dialog.winfo_height() // 2)
-        self.dialog.geometry(f"+{x}+{y}")
+        x = (self.dialog.winfo_screenwidth() // 2) - (width // 2)
+        y = (self.dialog.winfo_screenheight() // 2) - (height // 2)
+        self.dialog.geometry(f"{width}x{height}+{x}+{y}")
+        self.dialog.deiconify()
+
+        # Make modal (grab requires the window to be viewable)
+        self.dialog.grab_set()
 
         # Bind ESC to close dialog
         self.dialog.bind('<Escape>', lambda e: self.dialog.destroy())
@@ -64,7 +83,8 @@ class CategoryDialog:
             list_frame,
             yscrollcommand=scrollbar.set,
             selectmode=tk.SINGLE,
-            height=15
+            height=15,
+            foreground=DEFAULT_ITEM_COLOR
         )
         self.category_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.config(command=self.category_listbox.yview)
@@ -109,8 +129,8 @@ class CategoryDialog:
         stats_frame = ttk.LabelFrame(edit_frame, text="Statistics", padding="5")
         stats_frame.pack(fill=tk.X, pady=(10, 10))
 
-        self.stats_var = tk.StringVar(value="No category selected")
-        ttk.Label(stats_frame, textvariable=self.stats_var).pack()
+        self.stats_label = ttk.Label(stats_frame, text="No category selected")
+        self.stats_label.pack()
 
         # Buttons
         button_frame = ttk.Frame(edit_frame)
@@ -147,29 +167,47 @@ class CategoryDialog:
     def _load_categories(self):
         """Load categories from database."""
         self.categories = self.db_manager.get_categories()
+
+        # Validate colors once so the list refresh never has to guard itemconfig
+        for category in self.categories:
+            category._safe_color = _sanitize_color(category.color)
+
         self._refresh_list()
 
     def _refresh_list(self):
         """Refresh the category list."""
         self.category_listbox.delete(0, tk.END)
 
-        for category in self.categories:
-            # Show hierarchy with indentation
-            if category.parent_id:
-                display_name = f"  → {category.name}"
-            else:
-                display_name = category.name
-
-            self.category_listbox.insert(tk.END, display_name)
+        # Insert all rows in a single Tcl call
+        self.category_listbox.insert(
+            tk.END, *(self._display_name(category) for category in self.categories)
+        )
 
-            # Set item color
-            try:
-                self.category_listbox.itemconfig(
-                    tk.END,
-                    foreground=category.color
-                )
-            except:
-                pass  # Color might not be valid
+        # Set item colors (pre-validated in _load_categories); rows that already
+        # use the default color don't need a round-trip
+        itemconfig = self.category_listbox.itemconfig
+        for i, category in enumerate(self.categories):
+            if category._safe_color != DEFAULT_ITEM_COLOR:
+                itemconfig(i, foreground=category._safe_color)
+
+    def _insert_row(self, index, category: Category):
+        """Insert a single category row at the given listbox index."""
+        self.category_listbox.insert(index, self._display_name(category))
+        if category._safe_color != DEFAULT_ITEM_COLOR:
+            self.category_listbox.itemconfig(index, foreground=category._safe_color)
+
+    def _sorted_index(self, category: Category) -> int:
+        """Get the list position of a category in get_categories() order."""
+        return bisect.bisect_right(self.categories, _category_sort_key(category),
+                                   key=_category_sort_key)
+
+    @staticmethod
+    def _display_name(category: Category) -> str:
+        """Get the listbox label for a category."""
+        # Show hierarchy with indentation
+        if category.parent_id:
+            return f"  → {category.name}"
+        return category.name
 
     def _on_select(self, event):
         """Handle category selection."""
@@ -198,14 +236,14 @@ class CategoryDialog:
         links = self.db_manager.get_links(category_id=self.selected_category.id)
         link_count = len(links)
 
-        self.stats_var.set(f"{link_count} links in this category")
+        self.stats_label.config(text=f"{link_count} links in this category")
 
     def _clear_edit_panel(self):
         """Clear the edit panel."""
         self.name_var.set("")
         self.color_var.set("#808080")
         self.color_label.config(bg="#808080")
-        self.stats_var.set("No category selected")
+        self.stats_label.config(text="No category selected")
 
     def _choose_color(self):
         """Show color chooser dialog."""
@@ -246,6 +284,17 @@ class CategoryDialog:
                 if success:
                     self.selected_category.name = name
                     self.selected_category.color = color
+                    self.selected_category._safe_color = _sanitize_color(color)
+
+                    # Re-render only the edited row, moved to its sorted position
+                    index = self.categories.index(self.selected_category)
+                    del self.categories[index]
+                    self.category_listbox.delete(index)
+                    index = self._sorted_index(self.selected_category)
+                    self.categories.insert(index, self.selected_category)
+                    self._insert_row(index, self.selected_category)
+                    self.category_listbox.selection_set(index)
+                    self.category_listbox.see(index)
                     messagebox.showinfo("Success", "Category updated successfully")
             else:
                 # Create new category
@@ -253,10 +302,14 @@ class CategoryDialog:
                     name=name,
                     color=color
                 )
-                messagebox.showinfo("Success", f"Category '{name}' created successfully")
+                new_category._safe_color = _sanitize_color(new_category.color)
 
-            # Reload categories
-            self._load_categories()
+                # Insert the new row at its sorted position instead of
+                # reloading the whole list
+                index = self._sorted_index(new_category)
+                self.categories.insert(index, new_category)
+                self._insert_row(index, new_category)
+                messagebox.showinfo("Success", f"Category '{name}' created successfully")
 
         except Exception as e:
             messagebox.showerror("Save Error", f"Failed to save category: {e}")
@@ -281,8 +334,13 @@ class CategoryDialog:
 
         try:
             if self.db_manager.delete_category(self.selected_category.id):
+                # Remove just the deleted row
+                index = self.categories.index(self.selected_category)
+                self.categories.pop(index)
+                self.category_listbox.delete(index)
+                self.selected_category = None
+
                 messagebox.showinfo("Success", "Category deleted successfully")
-                self._load_categories()
                 self._clear_edit_panel()
             else:
                 messagebox.showerror("Delete Error", "Failed to delete category")
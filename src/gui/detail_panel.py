@@ -5,7 +5,7 @@ Detail panel for viewing and editing link information.
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Optional, Callable
-import webbrowser
+import threading
 
 from database.models import Link
 from database.db_manager import DatabaseManager
@@ -72,6 +72,10 @@ class DetailPanel(ttk.Frame):
         self.category_frame = ttk.Frame(cat_frame)
         self.category_frame.pack(fill=tk.X)
         self.category_vars = {}
+        self._categories_dirty = False
+
+        # Defer rebuilding checkboxes until the section is actually shown
+        self.category_frame.bind('<Map>', self._on_category_frame_map)
 
         # Tags section
         tag_frame = ttk.LabelFrame(container, text="Tags", padding="5")
@@ -112,18 +116,18 @@ class DetailPanel(ttk.Frame):
 
         # Access count
         ttk.Label(stats_grid, text="Access Count:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.access_count_var = tk.StringVar()
-        ttk.Label(stats_grid, textvariable=self.access_count_var).grid(row=0, column=1, sticky=tk.W, padx=(10, 0))
+        self.access_count_label = ttk.Label(stats_grid)
+        self.access_count_label.grid(row=0, column=1, sticky=tk.W, padx=(10, 0))
 
         # Last accessed
         ttk.Label(stats_grid, text="Last Accessed:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.last_accessed_var = tk.StringVar()
-        ttk.Label(stats_grid, textvariable=self.last_accessed_var).grid(row=1, column=1, sticky=tk.W, padx=(10, 0))
+        self.last_accessed_label = ttk.Label(stats_grid)
+        self.last_accessed_label.grid(row=1, column=1, sticky=tk.W, padx=(10, 0))
 
         # Created
         ttk.Label(stats_grid, text="Created:").grid(row=2, column=0, sticky=tk.W, pady=2)
-        self.created_var = tk.StringVar()
-        ttk.Label(stats_grid, textvariable=self.created_var).grid(row=2, column=1, sticky=tk.W, padx=(10, 0))
+        self.created_label = ttk.Label(stats_grid)
+        self.created_label.grid(row=2, column=1, sticky=tk.W, padx=(10, 0))
 
         # Favorite checkbox
         self.favorite_var = tk.BooleanVar()
@@ -183,19 +187,20 @@ class DetailPanel(ttk.Frame):
                 self.notes_text.insert('1.0', link.notes)
 
             # Set statistics
-            self.access_count_var.set(str(link.access_count))
+            self.access_count_label.config(text=str(link.access_count))
 
             if link.last_accessed_at:
-                self.last_accessed_var.set(link.last_accessed_at.strftime('%Y-%m-%d %H:%M:%S'))
+                self.last_accessed_label.config(text=link.last_accessed_at.strftime('%Y-%m-%d %H:%M:%S'))
             else:
-                self.last_accessed_var.set('Never')
+                self.last_accessed_label.config(text='Never')
 
             if link.created_at:
-                self.created_var.set(link.created_at.strftime('%Y-%m-%d %H:%M:%S'))
+                self.created_label.config(text=link.created_at.strftime('%Y-%m-%d %H:%M:%S'))
             else:
-                self.created_var.set('Unknown')
+                self.created_label.config(text='Unknown')
 
             # Update categories
+            self._categories_dirty = True
             self._update_categories()
 
         else:
@@ -211,12 +216,13 @@ class DetailPanel(ttk.Frame):
         self.url_var.set('')
         self.tags_var.set('')
         self.notes_text.delete('1.0', tk.END)
-        self.access_count_var.set('--')
-        self.last_accessed_var.set('--')
-        self.created_var.set('--')
+        self.access_count_label.config(text='--')
+        self.last_accessed_label.config(text='--')
+        self.created_label.config(text='--')
         self.favorite_var.set(False)
 
         # Clear categories
+        self._categories_dirty = False
         for widget in self.category_frame.winfo_children():
             widget.destroy()
         self.category_vars = {}
@@ -234,8 +240,21 @@ class DetailPanel(ttk.Frame):
         self.notes_text.config(state=state)
         self.favorite_check.config(state=state)
 
+    def _on_category_frame_map(self, event):
+        """Rebuild pending category checkboxes once the section becomes visible."""
+        if self._categories_dirty:
+            self._do_update_categories()
+
     def _update_categories(self):
-        """Update category checkboxes."""
+        """Update category checkboxes, deferring the rebuild while hidden."""
+        if not self.category_frame.winfo_ismapped():
+            return
+        self._do_update_categories()
+
+    def _do_update_categories(self):
+        """Rebuild category checkboxes for the current link."""
+        self._categories_dirty = False
+
         # Clear existing checkboxes
         for widget in self.category_frame.winfo_children():
             widget.destroy()
@@ -253,9 +272,9 @@ class DetailPanel(ttk.Frame):
             return
 
         # Get link's categories
-        link_categories = set()
+        link_categories = frozenset()
         if self.current_link:
-            link_categories = {cat.id for cat in self.current_link.categories}
+            link_categories = self.current_link.category_id_set
 
         # Create checkboxes in a grid
         row = 0
@@ -300,22 +319,24 @@ class DetailPanel(ttk.Frame):
                 is_favorite=self.current_link.is_favorite
             )
 
-            # Update categories
-            # First, remove all existing categories
-            for category in self.current_link.categories:
-                self.db_manager.remove_link_from_category(
-                    self.current_link.id,
-                    category.id
-                )
-
-            # Add selected categories
-            for cat_id, (var, category) in self.category_vars.items():
-                if var.get():
-                    self.db_manager.add_link_to_category(
+            # Update categories (skipped if the checkboxes were never shown,
+            # since the user cannot have changed them)
+            if not self._categories_dirty:
+                # First, remove all existing categories
+                for category in self.current_link.categories:
+                    self.db_manager.remove_link_from_category(
                         self.current_link.id,
-                        cat_id
+                        category.id
                     )
 
+                # Add selected categories
+                for cat_id, (var, category) in self.category_vars.items():
+                    if var.get():
+                        self.db_manager.add_link_to_category(
+                            self.current_link.id,
+                            cat_id
+                        )
+
             # Update tags
             tag_text = self.tags_var.get().strip()
             new_tags = set()
@@ -323,7 +344,7 @@ class DetailPanel(ttk.Frame):
                 new_tags = {tag.strip() for tag in tag_text.split(',') if tag.strip()}
 
             # Get current tags
-            current_tags = {tag.name for tag in self.current_link.tags}
+            current_tags = self.current_link.tag_name_set
 
             # Remove old tags
             for tag in self.current_link.tags:
@@ -385,4 +406,9 @@ class DetailPanel(ttk.Frame):
     def _open_url(self):
         """Open the current URL in browser."""
         if self.current_link:
-            webbrowser.open(self.current_link.url)
\ No newline at end of file
+            import webbrowser
+
+            # Open in background thread - browser cold-start can block the UI
+            thread = threading.Thread(target=webbrowser.open, args=(self.current_link.url,))
+            thread.daemon = True
+            thread.start()
\ No newline at end of file
@@ -6,10 +6,14 @@ Allows users to create, edit, and manage URL filters to exclude certain domains
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from typing import Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Item ID of the placeholder row shown while filters load
+LOADING_ITEM = 'loading'
+
 
 class FilterDialog:
     """Dialog for managing URL filters."""
@@ -24,6 +28,10 @@ class FilterDialog:
         """
         self.db_manager = db_manager
         self.on_update = on_update
+        self._filter_by_id = {}  # Loaded filters keyed by ID (tree iid)
+
+        # Worker for database reads, so the dialog never blocks on a query
+        self._executor = ThreadPoolExecutor(max_workers=1)
 
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
@@ -46,6 +54,12 @@ class FilterDialog:
 
         # Bind ESC to close dialog
         self.dialog.bind('<Escape>', lambda e: self.dialog.destroy())
+        self.dialog.bind('<Destroy>', self._on_destroy)
+
+    def _on_destroy(self, event):
+        """Stop the worker when the dialog closes."""
+        if event.widget is self.dialog:
+            self._executor.shutdown(wait=False)
 
     def _create_widgets(self):
         """Create and layout dialog widgets."""
@@ -129,44 +143,93 @@ class FilterDialog:
         self.tree.bind('<Double-Button-1>', lambda e: self._edit_filter())
 
     def _load_filters(self):
-        """Load filters from database."""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        """Load filters from database in a background thread."""
+        # Show a placeholder until the first query returns; later reloads
+        # keep the current rows and merge in the differences
+        if not self.tree.get_children():
+            self.tree.insert('', tk.END, iid=LOADING_ITEM, values=("Loading...", "", "", ""))
 
         # Get all filters (including inactive ones)
-        filters = self.db_manager.get_filters(active_only=False)
+        future = self._executor.submit(self.db_manager.get_filters, active_only=False)
+        future.add_done_callback(self._on_filters_loaded)
+
+    def _on_filters_loaded(self, future):
+        """Pass loaded filters to the main thread (runs in the worker thread)."""
+        try:
+            filters = future.result()
+        except Exception as e:
+            logger.error(f"Error loading filters: {e}")
+            filters = []
 
-        # Add to tree
-        for filter_obj in filters:
-            status = "Active" if filter_obj.is_active else "Inactive"
-            values = (filter_obj.pattern, filter_obj.filter_type,
-                     filter_obj.description or "", status)
+        try:
+            self.dialog.after(0, self._populate_tree, filters)
+        except (tk.TclError, RuntimeError):
+            pass  # Dialog was closed while loading
+
+    def _populate_tree(self, filters):
+        """Fill the tree with loaded filters (in main thread)."""
+        if not self.dialog.winfo_exists():
+            return
+
+        old_by_id = self._filter_by_id
+        self._filter_by_id = {filter_obj.id: filter_obj for filter_obj in filters}
 
-            # Add with tag for styling inactive filters
-            tags = () if filter_obj.is_active else ('inactive',)
-            item = self.tree.insert('', tk.END, values=values, tags=tags)
+        # Delete only rows whose filters are gone
+        stale = [item for item in self.tree.get_children()
+                 if item == LOADING_ITEM or int(item) not in self._filter_by_id]
+        if stale:
+            self.tree.delete(*stale)
 
-            # Store filter object as item data
-            self.tree.set(item, 'Pattern', filter_obj.pattern)
-            self.tree.item(item, tags=tags + (str(filter_obj.id),))
+        # Insert new rows, update changed ones and put everything in order
+        for index, filter_obj in enumerate(filters):
+            old = old_by_id.get(filter_obj.id)
+            if old is None or not self.tree.exists(str(filter_obj.id)):
+                self._insert_filter_row(filter_obj, index)
+                continue
+
+            if (old.pattern, old.filter_type, old.description, old.is_active) != \
+                    (filter_obj.pattern, filter_obj.filter_type, filter_obj.description, filter_obj.is_active):
+                values, tags = self._filter_row(filter_obj)
+                self.tree.item(str(filter_obj.id), values=values, tags=tags)
+            self.tree.move(str(filter_obj.id), '', index)
 
         # Style inactive items
         self.tree.tag_configure('inactive', foreground='gray')
 
+    @staticmethod
+    def _filter_row(filter_obj):
+        """Get the tree values and tags for a filter."""
+        status = "Active" if filter_obj.is_active else "Inactive"
+        values = (filter_obj.pattern, filter_obj.filter_type,
+                 filter_obj.description or "", status)
+
+        # Tag for styling inactive filters
+        tags = () if filter_obj.is_active else ('inactive',)
+        return values, tags
+
+    def _insert_filter_row(self, filter_obj, index=tk.END):
+        """Insert a tree row for a filter, using the filter ID as the item ID."""
+        values, tags = self._filter_row(filter_obj)
+        self.tree.insert('', index, iid=str(filter_obj.id), values=values, tags=tags)
+
     def _add_filter(self):
         """Add a new filter."""
         dialog = FilterEditDialog(self.dialog, self.db_manager)
         if dialog.result:
             pattern, filter_type, description = dialog.result
             try:
-                self.db_manager.create_filter(
+                filter_obj = self.db_manager.create_filter(
                     pattern=pattern,
                     filter_type=filter_type,
                     description=description,
                     is_active=True
                 )
-                self._load_filters()
+
+                # Insert just the new row, keeping the list ordered by pattern
+                index = sum(1 for existing in self._filter_by_id.values()
+                            if existing.pattern < filter_obj.pattern)
+                self._filter_by_id[filter_obj.id] = filter_obj
+                self._insert_filter_row(filter_obj, index)
                 if self.on_update:
                     self.on_update()
                 messagebox.showinfo("Success", f"Filter '{pattern}' added successfully")
@@ -179,7 +242,7 @@ class FilterDialog:
     def _edit_filter(self):
         """Edit selected filter."""
         selection = self.tree.selection()
-        if not selection:
+        if not selection or selection[0] == LOADING_ITEM:
             messagebox.showwarning("No Selection", "Please select a filter to edit")
             return
 
@@ -189,17 +252,7 @@ class FilterDialog:
         filter_type = values[1]
         description = values[2]
 
-        # Get filter ID from tags
-        tags = self.tree.item(item, 'tags')
-        filter_id = None
-        for tag in tags:
-            if tag.isdigit():
-                filter_id = int(tag)
-                break
-
-        if not filter_id:
-            messagebox.showerror("Error", "Could not identify filter")
-            return
+        filter_id = int(item)
 
         dialog = FilterEditDialog(self.dialog, self.db_manager,
                                  pattern, filter_type, description)
@@ -212,7 +265,13 @@ class FilterDialog:
                     filter_type=new_type,
                     description=new_description
                 )
-                self._load_filters()
+
+                # Update the edited row in place
+                filter_obj = self._filter_by_id[filter_id]
+                filter_obj.pattern = new_pattern
+                filter_obj.filter_type = new_type
+                filter_obj.description = new_description
+                self.tree.item(item, values=(new_pattern, new_type, new_description, values[3]))
                 if self.on_update:
                     self.on_update()
                 messagebox.showinfo("Success", "Filter updated successfully")
@@ -222,7 +281,7 @@ class FilterDialog:
     def _toggle_filter(self):
         """Toggle filter active/inactive status."""
         selection = self.tree.selection()
-        if not selection:
+        if not selection or selection[0] == LOADING_ITEM:
             messagebox.showwarning("No Selection", "Please select a filter to toggle")
             return
 
@@ -230,22 +289,17 @@ class FilterDialog:
         values = self.tree.item(item, 'values')
         current_status = values[3]
 
-        # Get filter ID from tags
-        tags = self.tree.item(item, 'tags')
-        filter_id = None
-        for tag in tags:
-            if tag.isdigit():
-                filter_id = int(tag)
-                break
-
-        if not filter_id:
-            messagebox.showerror("Error", "Could not identify filter")
-            return
+        filter_id = int(item)
 
         new_status = current_status != "Active"
         try:
             self.db_manager.update_filter(filter_id, is_active=new_status)
-            self._load_filters()
+
+            # Update the toggled row in place
+            self._filter_by_id[filter_id].is_active = new_status
+            values = list(values)
+            values[3] = "Active" if new_status else "Inactive"
+            self.tree.item(item, values=values, tags=() if new_status else ('inactive',))
             if self.on_update:
                 self.on_update()
         except Exception as e:
@@ -254,7 +308,7 @@ class FilterDialog:
     def _delete_filter(self):
         """Delete selected filter."""
         selection = self.tree.selection()
-        if not selection:
+        if not selection or selection[0] == LOADING_ITEM:
             messagebox.showwarning("No Selection", "Please select a filter to delete")
             return
 
@@ -266,21 +320,14 @@ class FilterDialog:
                                    f"Delete filter '{pattern}'?"):
             return
 
-        # Get filter ID from tags
-        tags = self.tree.item(item, 'tags')
-        filter_id = None
-        for tag in tags:
-            if tag.isdigit():
-                filter_id = int(tag)
-                break
-
-        if not filter_id:
-            messagebox.showerror("Error", "Could not identify filter")
-            return
+        filter_id = int(item)
 
         try:
             self.db_manager.delete_filter(filter_id)
-            self._load_filters()
+
+            # Remove just the deleted row
+            self.tree.delete(item)
+            self._filter_by_id.pop(filter_id, None)
             if self.on_update:
                 self.on_update()
             messagebox.showinfo("Success", "Filter deleted successfully")
@@ -294,26 +341,16 @@ class FilterDialog:
         if not url:
             return
 
-        if self.db_manager.should_track_url(url):
+        # Single pass that both decides and finds the matching filter
+        matched = self.db_manager.find_matching_filter(url)
+        if matched is None:
             messagebox.showinfo("Test Result",
                                f"URL '{url}' will be TRACKED\n\n"
                                "This URL does not match any active filter.")
         else:
-            # Find which filter matched
-            filters = self.db_manager.get_filters(active_only=True)
-            matched = None
-            for filter_obj in filters:
-                if filter_obj.matches(url):
-                    matched = filter_obj
-                    break
-
-            if matched:
-                messagebox.showinfo("Test Result",
-                                   f"URL '{url}' will be EXCLUDED\n\n"
-                                   f"Matched filter: '{matched.pattern}' (Type: {matched.filter_type})")
-            else:
-                messagebox.showinfo("Test Result",
-                                   f"URL '{url}' will be EXCLUDED")
+            messagebox.showinfo("Test Result",
+                               f"URL '{url}' will be EXCLUDED\n\n"
+                               f"Matched filter: '{matched.pattern}' (Type: {matched.filter_type})")
 
 
 class FilterEditDialog:
@@ -397,8 +434,8 @@ class FilterEditDialog:
             "Regex: '^https?://localhost' - Excludes localhost URLs"
         ]
 
-        for i, example in enumerate(examples):
-            ttk.Label(examples_frame, text=example, font=('', 9)).pack(anchor=tk.W)
+        ttk.Label(examples_frame, text='\n'.join(examples), font=('', 9),
+                  justify=tk.LEFT).pack(anchor=tk.W)
 
         # Buttons
         button_frame = ttk.Frame(main_frame)
@@ -3,12 +3,104 @@ Link list view component using Tkinter Treeview.
 """
 
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, messagebox
 from datetime import datetime
 from typing import List, Optional, Callable
 
 from database.models import Link
 from utils.config import get_config
+from gui.tree_utils import register_bulk_insert, bulk_insert
+
+# Fallback geometry used until a rendered row can be measured
+DEFAULT_ROW_HEIGHT = 20
+DEFAULT_HEADER_HEIGHT = 25
+
+# Rows scrolled per mouse wheel notch
+WHEEL_SCROLL_ROWS = 3
+
+# Opening more links than this at once asks for confirmation
+OPEN_CONFIRM_THRESHOLD = 10
+
+# Delay before a heading click sorts, so rapid clicks sort only once
+SORT_DEBOUNCE_MS = 50
+
+# Modifier bits in Tk event.state
+SHIFT_MASK = 0x0001
+CONTROL_MASK = 0x0004
+
+# Appended to truncated titles (single character keeps the Tcl payload small)
+ELLIPSIS = '\u2026'
+
+# Specialized formatters for common date formats - f-string formatting
+# avoids strftime's per-call directive parsing
+DATE_FORMATTERS = {
+    '%Y-%m-%d %H:%M': lambda dt: f'{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}',
+    '%Y-%m-%d %H:%M:%S': lambda dt: (f'{dt.year:04d}-{dt.month:02d}-{dt.day:02d} '
+                                     f'{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}'),
+    '%Y-%m-%d': lambda dt: f'{dt.year:04d}-{dt.month:02d}-{dt.day:02d}',
+}
+
+# Sort key per column, called with (link, formatted row values)
+SORT_KEYS = {
+    'favorite': lambda link, values: link.is_favorite,
+    'title': lambda link, values: values[1].lower(),
+    'url': lambda link, values: values[2].lower(),
+    'categories': lambda link, values: values[3].lower(),
+    'tags': lambda link, values: values[4].lower(),
+    'last_accessed': lambda link, values: link.last_accessed_at or datetime.min,
+    'access_count': lambda link, values: link.access_count or 0,
+    'browser': lambda link, values: values[7].lower(),
+}
+
+# Row tags indexed by (odd row << 1) | favorite
+ROW_TAGS = ((), ('favorite',), ('oddrow',), ('oddrow', 'favorite'))
+
+
+def _make_date_formatter(date_format: str) -> Callable[[datetime], str]:
+    """Get a function that formats datetimes with the given strftime format."""
+    formatter = DATE_FORMATTERS.get(date_format)
+    if formatter is None:
+        formatter = lambda dt: dt.strftime(date_format)
+    return formatter
+
+
+def _format_link(link: Link, format_date: Callable[[datetime], str],
+                 max_title_length: int) -> tuple:
+    """Get display values for a link.
+
+    Args:
+        link: Link object
+        format_date: Formatter for the last accessed column
+        max_title_length: Titles longer than this are truncated
+
+    Returns:
+        Tuple of values for tree columns
+    """
+    # Format dates
+    last_accessed = format_date(link.last_accessed_at) if link.last_accessed_at else ''
+
+    # Format categories and tags
+    categories = ', '.join([cat.name for cat in link.categories]) if link.categories else ''
+    tags = ', '.join([tag.name for tag in link.tags]) if link.tags else ''
+
+    # Keep original title and URL (including Korean/Unicode characters)
+    title = link.title or link.url or "Unknown"
+    url = link.url or ""
+
+    # Truncate if needed
+    if len(title) > max_title_length:
+        title = title[:max_title_length - 1] + ELLIPSIS
+
+    return (
+        '❤' if link.is_favorite else '',  # Heart symbol for favorites
+        title,  # Keep original title with Unicode/Korean
+        url,    # Keep original URL
+        categories,
+        tags,
+        last_accessed,
+        str(link.access_count) if link.access_count else '0',
+        ''  # Browser info not stored directly on Link yet
+    )
 
 
 class LinkListView(ttk.Frame):
@@ -17,7 +109,8 @@ class LinkListView(ttk.Frame):
     def __init__(self, parent, on_select: Optional[Callable] = None,
                  on_double_click: Optional[Callable] = None,
                  on_toggle_favorite: Optional[Callable] = None,
-                 on_delete: Optional[Callable] = None):
+                 on_delete: Optional[Callable] = None,
+                 on_scroll_end: Optional[Callable] = None):
         """Initialize the link list view.
 
         Args:
@@ -26,6 +119,7 @@ class LinkListView(ttk.Frame):
             on_double_click: Callback when a link is double-clicked
             on_toggle_favorite: Callback when toggling favorite status
             on_delete: Callback when deleting links
+            on_scroll_end: Callback when the last row comes into view
         """
         super().__init__(parent)
 
@@ -34,12 +128,24 @@ class LinkListView(ttk.Frame):
         self.on_double_click = on_double_click
         self.on_toggle_favorite = on_toggle_favorite
         self.on_delete = on_delete
+        self.on_scroll_end = on_scroll_end
         self.links = []
-        self.link_map = {}  # Map tree items to Link objects
+        self._value_cache = []  # Formatted row values, parallel to self.links
+        self._row_values = {}  # link.id -> formatted row values for the last set_links
+        self.link_map = {}  # Map visible tree items to Link objects
+
+        # Virtual scrolling state - only the rows in the viewport exist in the tree
+        self._first_index = 0
+        self._row_height = None
+        self._header_height = None
+        self._selected = {}  # Selected links by ID, including rows scrolled out of view
+        self._replace_selection = False
+        self._at_end = False  # Last row was in view at the last render
         
         # Sort state tracking
         self.current_sort_column = None
         self.sort_descending = True
+        self._sort_after_id = None
 
         self._build_ui()
 
@@ -86,10 +192,12 @@ class LinkListView(ttk.Frame):
             selectmode='extended'
         )
 
-        # Configure scrollbars
-        v_scroll.config(command=self.tree.yview)
+        # Configure scrollbars - the vertical one drives the virtual window
+        # instead of the tree's own yview
+        self.v_scroll = v_scroll
+        v_scroll.config(command=self._on_yscroll)
         h_scroll.config(command=self.tree.xview)
-        self.tree.config(yscrollcommand=v_scroll.set, xscrollcommand=h_scroll.set)
+        self.tree.config(xscrollcommand=h_scroll.set)
 
         # Configure columns
         self.tree.column('#0', width=0, stretch=False)  # Hide tree column
@@ -97,7 +205,7 @@ class LinkListView(ttk.Frame):
         for col_id, col_name, default_width in column_defs:
             width = self.config.get(f'column_widths.{col_id}', default_width)
             self.tree.column(col_id, width=width, minwidth=30)
-            self.tree.heading(col_id, text=col_name, command=lambda c=col_id: self._sort_by_column(c))
+            self.tree.heading(col_id, text=col_name, command=lambda c=col_id: self._request_sort(c))
 
         # Style alternating rows
         self.tree.tag_configure('oddrow', background='#f0f0f0')
@@ -107,9 +215,23 @@ class LinkListView(ttk.Frame):
         self.tree.bind('<<TreeviewSelect>>', self._on_select)
         self.tree.bind('<Double-Button-1>', self._on_double_click)
         self.tree.bind('<Button-3>', self._on_right_click)  # Right-click
+        self.tree.bind('<ButtonPress-1>', self._on_button_press)
+        self.tree.bind('<Up>', lambda e: self._on_arrow_key(e, -1))
+        self.tree.bind('<Down>', lambda e: self._on_arrow_key(e, 1))
+        self.tree.bind('<Prior>', lambda e: self._on_page_key(e, -1))
+        self.tree.bind('<Next>', lambda e: self._on_page_key(e, 1))
+        self.tree.bind('<Home>', lambda e: self._on_end_key(e, 0))
+        self.tree.bind('<End>', lambda e: self._on_end_key(e, -1))
+        self.tree.bind('<Configure>', self._on_configure)
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', self._on_mousewheel)  # Linux scroll up
+        self.tree.bind('<Button-5>', self._on_mousewheel)  # Linux scroll down
 
         self.tree.pack(fill=tk.BOTH, expand=True)
 
+        # Register the bulk insert helper with the Tcl interpreter
+        register_bulk_insert(self.tree)
+
         # Create context menu
         self._create_context_menu()
 
@@ -123,106 +245,289 @@ class LinkListView(ttk.Frame):
         self.context_menu.add_separator()
         self.context_menu.add_command(label="Delete", command=self._delete_selected)
 
-    def set_links(self, links: List[Link]):
+    def set_links(self, links: List[Link], visible_links: Optional[List[Link]] = None):
         """Set the links to display.
 
+        Only the rows that fit in the viewport are inserted into the tree;
+        scrolling re-renders the window from the in-memory list.
+
         Args:
             links: List of Link objects
+            visible_links: Subset of links to show (see show_links); all if None
+        """
+        # Format every row once; scrolling, sorting and filtering reuse the values
+        format_date = _make_date_formatter(self.config.get('date_format', '%Y-%m-%d %H:%M'))
+        max_title_length = self.config.get('max_title_length', 80)
+
+        self._row_values = {
+            link.id: _format_link(link, format_date, max_title_length) for link in links
+        }
+        self.show_links(links if visible_links is None else visible_links)
+
+    def show_links(self, links: List[Link]):
+        """Show a subset of the links last passed to set_links.
+
+        Rows are taken from the formatted-value cache, so narrowing or widening
+        a filter does not re-format anything.
+
+        Args:
+            links: Links from the last set_links call, in display order
+        """
+        row_values = self._row_values
+        self.links = list(links)  # Own copy - append_links extends it
+        self._value_cache = [row_values[link.id] for link in links]
+        self._apply_sort()
+        self._selected = {}
+        self._at_end = False  # A new list may report its end once
+        self._render_window(0)
+
+    def append_links(self, links: List[Link], visible_links: Optional[List[Link]] = None):
+        """Add links after the current ones, keeping scroll position and selection.
+
+        Args:
+            links: List of Link objects to add
+            visible_links: Subset of links to show; all if None
+        """
+        format_date = _make_date_formatter(self.config.get('date_format', '%Y-%m-%d %H:%M'))
+        max_title_length = self.config.get('max_title_length', 80)
+
+        row_values = self._row_values
+        for link in links:
+            row_values[link.id] = _format_link(link, format_date, max_title_length)
+
+        shown = links if visible_links is None else visible_links
+        self.links.extend(shown)
+        self._value_cache.extend(row_values[link.id] for link in shown)
+
+        # New rows go to their sorted position if a column sort is active
+        if shown and self._apply_sort():
+            self._render_window(self._first_index)
+        # Only a partly filled window needs new rows; otherwise just resize the thumb
+        elif shown and len(self.link_map) < self._visible_row_count():
+            self._render_window(self._first_index)
+        else:
+            self._update_scrollbar()
+
+    def _render_window(self, first_index: int):
+        """Render the rows that fit in the viewport, starting at first_index.
+
+        Args:
+            first_index: Index into self.links of the first row to show
         """
+        visible = self._visible_row_count()
+        first_index = self._clamp_first_index(first_index, visible)
+        last_index = min(first_index + visible, len(self.links))
+        self._first_index = first_index
+
         # Clear existing items
         self.tree.delete(*self.tree.get_children())
-        self.links = links
         self.link_map = {}
 
-        # Limit display for performance
-        # TODO: Implement virtual scrolling or pagination
-        max_display = 2000  # Display up to 2000 items for reasonable performance
-        display_links = links[:max_display] if len(links) > max_display else links
+        # Bind hot-loop lookups to locals
+        links = self.links
+        values = self._value_cache
+        link_map = self.link_map
+        selected = self._selected
 
-        # Add links to tree
-        added_count = 0
-        error_count = 0
+        # Build all rows, then insert them in one Tcl call
+        rows = []
+        add_row = rows.append
+        for i in range(first_index, last_index):
+            add_row(values[i])
+            add_row(ROW_TAGS[(i & 1) << 1 | bool(links[i].is_favorite)])
 
-        # Process in smaller batches to avoid GUI freezing
-        batch_size = 100
+        items = bulk_insert(self.tree, ('-values', '-tags'), rows)
 
-        for batch_start in range(0, len(display_links), batch_size):
-            batch_end = min(batch_start + batch_size, len(display_links))
+        selected_items = []
+        for item, link in zip(items, links[first_index:last_index]):
+            link_map[item] = link
+            if link.id in selected:
+                selected_items.append(item)
 
-            for i in range(batch_start, batch_end):
-                if i >= len(display_links):
-                    break
+        # Restore selection for rows scrolled back into view
+        if selected_items:
+            self.tree.selection_set(selected_items)
 
-                link = display_links[i]
-                try:
-                    # Get values - this should never fail now with the new implementation
-                    values = self._get_link_values(link)
-                    tags = ('oddrow',) if i % 2 else ()
-                    if link.is_favorite:
-                        tags = tags + ('favorite',)
+        # Re-render once the real row height is known
+        if self._measure_rows():
+            self._render_window(first_index)
+            return
 
-                    item = self.tree.insert('', 'end', values=values, tags=tags)
-                    self.link_map[item] = link
-                    added_count += 1
-                except Exception as e:
-                    # Skip this link if there's an error
-                    error_count += 1
-                    continue
+        self._update_scrollbar()
 
-            # Update GUI every batch to prevent freezing
-            if hasattr(self, 'update'):
-                self.update()
+    def _visible_row_count(self) -> int:
+        """Get the number of rows that fit in the tree viewport."""
+        height = self.tree.winfo_height()
+        if height <= 1:
+            # Not mapped yet - use the configured height in rows
+            return int(self.tree.cget('height'))
 
-    def _get_link_values(self, link: Link) -> list:
-        """Get display values for a link.
+        row_height = self._row_height or DEFAULT_ROW_HEIGHT
+        header_height = self._header_height or DEFAULT_HEADER_HEIGHT
+        return max(1, (height - header_height) // row_height)
 
-        Args:
-            link: Link object
+    def _clamp_first_index(self, first_index: int, visible: int) -> int:
+        """Clamp a window start index so the window stays within the links."""
+        return max(0, min(first_index, len(self.links) - visible))
+
+    def _measure_rows(self) -> bool:
+        """Measure row and header height from a rendered row.
 
         Returns:
-            List of values for tree columns
+            True if the measurement was taken for the first time
         """
-        # Format dates
-        date_format = self.config.get('date_format', '%Y-%m-%d %H:%M')
-        last_accessed = ''
-        if link.last_accessed_at:
-            try:
-                last_accessed = link.last_accessed_at.strftime(date_format)
-            except:
-                last_accessed = ''
-
-        # Format categories and tags safely
-        try:
-            categories = ', '.join(cat.name for cat in link.categories)
-        except:
-            categories = ''
-
-        try:
-            tags = ', '.join(tag.name for tag in link.tags)
-        except:
-            tags = ''
-
-        # Get title and URL - keep Unicode for proper display
-        max_title_length = self.config.get('max_title_length', 80)
+        if self._row_height:
+            return False
+
+        children = self.tree.get_children()
+        if not children:
+            return False
+
+        bbox = self.tree.bbox(children[0])
+        if not bbox:
+            return False  # Tree not mapped yet
+
+        self._header_height = bbox[1]
+        self._row_height = bbox[3]
+        return True
+
+    def _update_scrollbar(self):
+        """Sync the vertical scrollbar with the rendered window."""
+        total = len(self.links)
+        last_index = self._first_index + len(self.link_map)
+        if total:
+            self.v_scroll.set(self._first_index / total, last_index / total)
+        else:
+            self.v_scroll.set(0, 1)
+
+        # Report only the move to the end, not every render while there,
+        # so a short list does not pull in page after page by itself
+        at_end = last_index >= total
+        if at_end and not self._at_end and self.on_scroll_end:
+            self._at_end = at_end
+            self.on_scroll_end()
+        else:
+            self._at_end = at_end
+
+    def _scroll_to(self, first_index: int):
+        """Scroll the virtual window so first_index is the top row."""
+        first_index = self._clamp_first_index(first_index, self._visible_row_count())
+        if first_index != self._first_index:
+            self._render_window(first_index)
+
+    def _on_yscroll(self, *args):
+        """Translate scrollbar commands into a new render window."""
+        if args[0] == 'moveto':
+            first_index = int(float(args[1]) * len(self.links))
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            if args[2] == 'pages':
+                amount *= max(1, self._visible_row_count() - 1)
+            first_index = self._first_index + amount
+        else:
+            return
 
-        # Keep original title and URL (including Korean/Unicode characters)
-        title = link.title or link.url or "Unknown"
-        url = link.url or ""
-
-        # Truncate if needed
-        if len(title) > max_title_length:
-            title = title[:max_title_length - 3] + '...'
-
-        return [
-            '❤' if link.is_favorite else '',  # Heart symbol for favorites
-            title,  # Keep original title with Unicode/Korean
-            url,    # Keep original URL
-            categories,
-            tags,
-            last_accessed,
-            str(link.access_count) if link.access_count else '0',
-            ''  # Browser info not stored directly on Link yet
-        ]
+        self._scroll_to(first_index)
+
+    def _on_mousewheel(self, event):
+        """Scroll the virtual window with the mouse wheel."""
+        if event.num == 4 or event.delta > 0:
+            self._scroll_to(self._first_index - WHEEL_SCROLL_ROWS)
+        else:
+            self._scroll_to(self._first_index + WHEEL_SCROLL_ROWS)
+        return 'break'  # Keep the tree from scrolling its own view
+
+    def _on_configure(self, event):
+        """Re-render when the viewport can show a different number of rows."""
+        visible = self._visible_row_count()
+        first_index = self._clamp_first_index(self._first_index, visible)
+        expected = min(visible, len(self.links) - first_index)
+        if len(self.link_map) != expected or first_index != self._first_index:
+            self._render_window(first_index)
+
+    def _on_button_press(self, event):
+        """Note whether a click replaces the selection or extends it."""
+        if self.tree.identify_region(event.x, event.y) in ('cell', 'tree'):
+            if not event.state & (SHIFT_MASK | CONTROL_MASK):
+                self._replace_selection = True
+
+    def _on_arrow_key(self, event, step: int):
+        """Scroll the virtual window when the cursor moves past its edge."""
+        extend = event.state & SHIFT_MASK
+        if not extend:
+            self._replace_selection = True
+
+        children = self.tree.get_children()
+        focus = self.tree.focus()
+        if not children or focus not in self.link_map:
+            return None
+
+        position = children.index(focus)
+        if 0 <= position + step < len(children):
+            return None  # Still inside the window - default handling
+
+        target = self._first_index + position + step
+        if not 0 <= target < len(self.links):
+            return 'break'
+
+        self._scroll_to(self._first_index + step)
+        self._focus_index(target, extend)
+        return 'break'
+
+    def _on_page_key(self, event, direction: int):
+        """Move the view and the cursor by a page (Page Up/Page Down)."""
+        if not self.links:
+            return 'break'
+
+        page = max(1, self._visible_row_count() - 1)
+        target = self._focus_position() + direction * page
+        target = max(0, min(target, len(self.links) - 1))
+
+        self._scroll_to(self._first_index + direction * page)
+        self._focus_index(target, event.state & SHIFT_MASK)
+        return 'break'
+
+    def _on_end_key(self, event, index: int):
+        """Move the cursor to the first (Home) or last (End) row."""
+        if not self.links:
+            return 'break'
+
+        target = index % len(self.links)
+        self._scroll_to(target)
+        self._focus_index(target, event.state & SHIFT_MASK)
+        return 'break'
+
+    def _focus_position(self) -> int:
+        """Get the index in self.links of the focused row (top row if none)."""
+        focus = self.tree.focus()
+        if focus in self.link_map:
+            return self._first_index + self.tree.index(focus)
+        return self._first_index
+
+    def _focus_index(self, index: int, extend: bool):
+        """Focus and select the row at an index in self.links.
+
+        Scrolls the virtual window first if the row is not rendered.
+
+        Args:
+            index: Row index in self.links
+            extend: Add to the selection instead of replacing it
+        """
+        visible = self._visible_row_count()
+        if index < self._first_index:
+            self._scroll_to(index)
+        elif index >= self._first_index + visible:
+            self._scroll_to(index - visible + 1)
+
+        if not extend:
+            self._replace_selection = True
+
+        item = self.tree.get_children()[index - self._first_index]
+        self.tree.focus(item)
+        if extend:
+            self.tree.selection_add(item)
+        else:
+            self.tree.selection_set(item)
 
     def get_selected_links(self) -> List[Link]:
         """Get currently selected links.
@@ -230,17 +535,31 @@ class LinkListView(ttk.Frame):
         Returns:
             List of selected Link objects
         """
-        selected = []
-        for item in self.tree.selection():
-            if item in self.link_map:
-                selected.append(self.link_map[item])
-        return selected
+        return list(self._selected.values())
 
     def _on_select(self, event):
         """Handle selection change."""
-        selected = self.get_selected_links()
+        if self._replace_selection:
+            selected = {}
+        else:
+            # Keep selected rows that are scrolled out of view
+            visible_ids = {link.id for link in self.link_map.values()}
+            selected = {link_id: link for link_id, link in self._selected.items()
+                        if link_id not in visible_ids}
+        self._replace_selection = False
+
+        for item in self.tree.selection():
+            link = self.link_map.get(item)
+            if link:
+                selected[link.id] = link
+
+        # Re-selecting rows after a scroll is not a user selection change
+        if selected.keys() == self._selected.keys():
+            return
+        self._selected = selected
+
         if self.on_select and len(selected) == 1:
-            self.on_select(selected[0])
+            self.on_select(next(iter(selected.values())))
 
     def _on_double_click(self, event):
         """Handle double-click."""
@@ -253,22 +572,28 @@ class LinkListView(ttk.Frame):
         # Select item under cursor
         item = self.tree.identify('item', event.x, event.y)
         if item:
+            self._replace_selection = True
             self.tree.selection_set(item)
             self.context_menu.post(event.x_root, event.y_root)
 
     def _open_selected(self):
         """Open selected links in browser."""
         import webbrowser
-        for link in self.get_selected_links():
+        selected = self.get_selected_links()
+        if len(selected) > OPEN_CONFIRM_THRESHOLD:
+            if not messagebox.askyesno("Open Links",
+                                       f"Open {len(selected)} links in the browser?"):
+                return
+
+        for link in selected:
             webbrowser.open(link.url)
 
     def _copy_url(self):
-        """Copy selected URL to clipboard."""
+        """Copy selected URLs to clipboard, one per line."""
         selected = self.get_selected_links()
         if selected:
             self.clipboard_clear()
-            self.clipboard_append(selected[0].url)
-            self.update()  # Required for clipboard
+            self.clipboard_append('\n'.join([link.url for link in selected]))
 
     def _toggle_favorite(self):
         """Toggle favorite status of selected links."""
@@ -284,8 +609,8 @@ class LinkListView(ttk.Frame):
             if selected:
                 self.on_delete(selected)
 
-    def _sort_by_column(self, column: str):
-        """Sort tree by column.
+    def _request_sort(self, column: str):
+        """Handle a heading click, deferring the sort until clicks settle.
 
         Args:
             column: Column identifier to sort by
@@ -297,53 +622,47 @@ class LinkListView(ttk.Frame):
             self.current_sort_column = column
             self.sort_descending = True
 
-        # Get current data
-        data = []
-        for child in self.tree.get_children():
-            values = self.tree.item(child)['values']
-            link = self.link_map.get(child)
-            data.append((child, values, link))
-
-        # Determine sort key
-        col_index = {
-            'favorite': 0,
-            'title': 1,
-            'url': 2,
-            'categories': 3,
-            'tags': 4,
-            'last_accessed': 5,
-            'access_count': 6,
-            'browser': 7
-        }
+        if self._sort_after_id is None:
+            self._sort_after_id = self.after(SORT_DEBOUNCE_MS, self._do_sort)
 
-        if column in col_index:
-            idx = col_index[column]
-
-            # Special handling for different column types
-            if column == 'access_count':
-                # Sort numerically
-                data.sort(key=lambda x: int(x[1][idx]) if x[1][idx] else 0, reverse=self.sort_descending)
-            elif column == 'last_accessed':
-                # Sort by actual datetime
-                data.sort(key=lambda x: x[2].last_accessed_at if x[2] else datetime.min, reverse=self.sort_descending)
-            elif column == 'favorite':
-                # Sort by boolean
-                data.sort(key=lambda x: x[2].is_favorite if x[2] else False, reverse=self.sort_descending)
-            else:
-                # Sort alphabetically
-                data.sort(key=lambda x: x[1][idx].lower() if x[1][idx] else '', reverse=self.sort_descending)
+    def _do_sort(self):
+        """Run the pending sort."""
+        self._sort_after_id = None
+        self._sort_by_column(self.current_sort_column)
+
+    def _sort_by_column(self, column: str):
+        """Sort tree by column using the current sort direction.
+
+        Args:
+            column: Column identifier to sort by
+        """
+        self._apply_sort()
 
         # Update column heading to show sort direction
         self._update_sort_indicators(column)
 
-        # Reorder items
-        for i, (child, values, link) in enumerate(data):
-            self.tree.move(child, '', i)
-            # Update row styling
-            tags = ('oddrow',) if i % 2 else ()
-            if link and link.is_favorite:
-                tags = tags + ('favorite',)
-            self.tree.item(child, tags=tags)
+        # Redraw from the top
+        self._render_window(0)
+
+    def _apply_sort(self) -> bool:
+        """Order the in-memory rows by the current sort column, if any.
+
+        Returns:
+            True if the rows were sorted
+        """
+        key = SORT_KEYS.get(self.current_sort_column)
+        if not key:
+            return False
+
+        links = self.links
+        values = self._value_cache
+
+        # Sort row positions on the in-memory lists - no Tcl round-trips
+        order = sorted(range(len(links)), key=lambda i: key(links[i], values[i]),
+                       reverse=self.sort_descending)
+        self.links = [links[i] for i in order]
+        self._value_cache = [values[i] for i in order]
+        return True
 
     def _update_sort_indicators(self, sorted_column: str):
         """Update column headings to show sort direction."""
@@ -6,6 +6,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox, Menu
 import threading
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional, List
 
@@ -20,12 +21,18 @@ from utils.settings import SettingsManager
 from utils.browser_utils import BrowserManager
 from gui.link_list import LinkListView
 from gui.detail_panel import DetailPanel
-from gui.category_dialog import CategoryDialog
-from gui.trash_dialog import TrashDialog
-from gui.settings_dialog import SettingsDialog
 
 logger = logging.getLogger(__name__)
 
+# Delay before live search runs, so typing doesn't reload on every keystroke
+SEARCH_DEBOUNCE_MS = 300
+
+# Links loaded per background query; the list fills in page by page
+LINK_PAGE_SIZE = 500
+
+# Joins a link's searchable fields so a query can't match across two of them
+SEARCH_KEY_SEPARATOR = '\x00'
+
 
 class Tooltip:
     """Simple tooltip helper class."""
@@ -74,6 +81,9 @@ class MainWindow:
         self.settings_manager = SettingsManager()
         self.browser_manager = BrowserManager()
 
+        # Probe installed browsers in the background so the first open/settings use is warm
+        threading.Thread(target=self.browser_manager.detect_installed_browsers, daemon=True).start()
+
         # Initialize database
         self.db_manager = DatabaseManager()
 
@@ -82,12 +92,36 @@ class MainWindow:
 
         # Current filter/search state
         self.current_search = ""
-        self.current_category = None
+        self.current_category_id = None
         self.current_days_filter = None
 
         # Scan timer
         self.scan_timer = None
-        self.is_scanning = False
+        self._scan_slot = threading.Semaphore(1)  # Held while a scan is running
+        self._scan_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scan")
+
+        # Pending live search
+        self.search_timer = None
+
+        # Category ids parallel to the filter dropdown entries
+        self._category_ids = [None]
+
+        # Unsearched links for the current category/day filter
+        self._base_links = None
+        self._base_key = None
+        self._search_keys = []
+        self._listed_base = None  # Base list last passed to link_list.set_links
+
+        # Link queries run on a worker thread; only the latest result is shown
+        self._query_executor = ThreadPoolExecutor(max_workers=1)
+        self._query_seq = 0
+        self._loading_key = None
+        self._more_links = False  # Another page can be loaded on scroll
+        self._all_loaded = False  # Every link for the base key is in _base_links
+
+        # Searches that need the database (not every link is loaded)
+        self._search_seq = 0
+        self._showing_search_results = False
 
         # Build UI
         self._build_ui()
@@ -127,7 +161,8 @@ class MainWindow:
             on_select=self.on_link_selected,
             on_double_click=self.on_link_double_click,
             on_toggle_favorite=self.on_toggle_favorite,
-            on_delete=self.on_delete_links
+            on_delete=self.on_delete_links,
+            on_scroll_end=self._load_more_links
         )
         self.link_list.pack(fill=tk.BOTH, expand=True)
 
@@ -309,67 +344,222 @@ class MainWindow:
     def _update_category_filter(self):
         """Update category filter dropdown."""
         categories = self.db_manager.get_categories()
+        self._category_ids = [None] + [cat.id for cat in categories]
         category_names = ["All Categories"] + [cat.name for cat in categories]
         self.category_combo['values'] = category_names
         self.category_combo.set("All Categories")
+        self.current_category_id = None
 
     def refresh_links(self):
-        """Refresh the link list."""
-        try:
-            # Get filter parameters
-            category_id = None
-            if self.current_category:
-                # Look up category ID by name
-                categories = self.db_manager.get_categories()
-                for cat in categories:
-                    if cat.name == self.current_category:
-                        category_id = cat.id
-                        break
-
-            # Get links from database
-            # Only apply limit when not searching or filtering
-            limit = None
-            if not self.current_search and not self.current_days_filter and not category_id:
-                # When showing ALL links with no filters
-                limit = None  # Show all links when "All" is selected
-            else:
-                # Apply reasonable limit when filtering
-                limit = None
-
-            links = self.db_manager.get_links(
-                category_id=category_id,
-                search_query=self.current_search if self.current_search else None,
-                days_back=self.current_days_filter,
-                sort_by='last_accessed_at',
-                sort_desc=True,
-                limit=limit
-            )
+        """Refresh the link list, reloading the base result set from the database."""
+        self._base_links = None
+        self._loading_key = None
+        self._apply_search()
+
+    def _reload_from_db(self, base_key):
+        """Load the unsearched link list for a category/day filter in the background.
+
+        Only the first page is loaded here; later pages are loaded when the
+        list is scrolled to its end (see _load_more_links).
+
+        Args:
+            base_key: (category_id, days_back) tuple the result is cached under
+        """
+        self._query_seq += 1
+        self._search_seq += 1  # Results for the old filter are stale
+        self._loading_key = base_key
+        self._more_links = False
+        self._all_loaded = False
+        self._load_page(self._query_seq, base_key, None, min(LINK_PAGE_SIZE, self._max_links()))
+
+    def _max_links(self) -> int:
+        """Get the maximum number of links to load for the list."""
+        return self.settings_manager.get('max_links_display', 1000)
+
+    def _load_more_links(self):
+        """Load the next page of links once the end of the list is visible."""
+        # A search shows either every loaded match or database results,
+        # so scrolling to its end never needs another base page
+        if not self._more_links or self.current_search:
+            return
+        self._more_links = False  # Load each page only once
+
+        remaining = self._max_links() - len(self._base_links)
+        self._load_page(self._query_seq, self._base_key, self._base_links[-1].id,
+                        min(LINK_PAGE_SIZE, remaining))
+
+    def _load_page(self, seq: int, base_key, after_id: Optional[int], limit: int):
+        """Query one page of links on the worker thread.
+
+        Args:
+            seq: Query sequence number the page belongs to
+            base_key: (category_id, days_back) tuple
+            after_id: Last loaded link, or None for the first page
+            limit: Maximum number of links in the page
+        """
+        category_id, days_back = base_key
+        future = self._query_executor.submit(
+            self.db_manager.get_links,
+            category_id=category_id,
+            days_back=days_back,
+            sort_by='last_accessed_at',
+            sort_desc=True,
+            limit=limit,
+            after_id=after_id
+        )
+        future.add_done_callback(
+            lambda f: self._on_links_loaded(seq, base_key, after_id, limit, f)
+        )
 
-            # Update link list
-            self.link_list.set_links(links)
+    def _on_links_loaded(self, seq: int, base_key, after_id: Optional[int], limit: int, future):
+        """Pass loaded links to the main thread (runs in the worker thread)."""
+        try:
+            self.root.after(0, self._apply_links, seq, base_key, after_id, limit, future)
+        except (tk.TclError, RuntimeError):
+            pass  # Window was closed while loading
 
-            # Update status
-            self.link_count_text.set(f"{len(links)} links")
+    def _apply_links(self, seq: int, base_key, after_id: Optional[int], limit: int, future):
+        """Cache a loaded page of links and show it (in main thread)."""
+        if seq != self._query_seq:
+            return  # A newer query superseded this one
 
+        try:
+            page = future.result()
         except Exception as e:
             logger.error(f"Error refreshing links: {e}")
             self.set_status("Error loading links")
+            self._loading_key = None
+            return
+
+        # Case-fold the searchable fields once per load, not per keystroke
+        keys = [
+            SEARCH_KEY_SEPARATOR.join((link.url, link.title or '', link.notes or '')).casefold()
+            for link in page
+        ]
+
+        if after_id is None:
+            self._loading_key = None
+            self._base_links = page
+            self._search_keys = keys
+            self._base_key = base_key
+        else:
+            self._base_links.extend(page)
+            self._search_keys.extend(keys)
+
+        # A full page below the display cap means there may be more. Set
+        # before showing the rows, so a list that doesn't fill the view
+        # asks for the next page right away.
+        self._more_links = len(page) == limit and len(self._base_links) < self._max_links()
+        self._all_loaded = len(page) < limit  # A short page is the last one
+
+        if after_id is None:
+            self._apply_search()
+        elif not self._showing_search_results:
+            # Append to the displayed rows
+            self.link_list.append_links(page, visible_links=self._matching_links(page, keys))
+            self.link_count_text.set(f"{len(self.link_list.links)} links")
+
+    def _matching_links(self, links, keys):
+        """Get the links whose search keys contain the current search text."""
+        # Same fields as the SQL LIKE search: URL, title, notes
+        query = self.current_search.casefold()
+        if not query:
+            return links
+        return [link for link, key in zip(links, keys) if query in key]
+
+    def _apply_search(self):
+        """Filter the cached base links by the current search text.
+
+        The database is queried when the category/day filter changed or the
+        cache was invalidated. Search keystrokes filter in memory once every
+        link for the filter is loaded; until then they search the database,
+        so links beyond the loaded pages can still be found.
+        """
+        base_key = (self.current_category_id, self.current_days_filter)
+        if self._base_links is None or base_key != self._base_key:
+            # The load in flight applies the current search when it finishes
+            if base_key != self._loading_key:
+                self._reload_from_db(base_key)
+            return
+
+        if self.current_search and not self._all_loaded:
+            self._search_db(base_key, self.current_search)
+            return
+
+        # Drop any database search still in flight
+        self._search_seq += 1
+        self._showing_search_results = False
+
+        links = self._matching_links(self._base_links, self._search_keys)
+
+        # Update link list; rows are only formatted when the base list changes
+        if self._listed_base is not self._base_links:
+            self._listed_base = self._base_links
+            self.link_list.set_links(self._base_links, visible_links=links)
+        else:
+            self.link_list.show_links(links)
+
+        # Update status
+        self.link_count_text.set(f"{len(links)} links")
+
+    def _search_db(self, base_key, query: str):
+        """Search all links for a category/day filter in the background.
+
+        Args:
+            base_key: (category_id, days_back) tuple
+            query: Search text
+        """
+        self._search_seq += 1
+        seq = self._search_seq
+
+        category_id, days_back = base_key
+        future = self._query_executor.submit(
+            self.db_manager.get_links,
+            category_id=category_id,
+            search_query=query,
+            days_back=days_back,
+            sort_by='last_accessed_at',
+            sort_desc=True,
+            limit=self._max_links()
+        )
+        future.add_done_callback(lambda f: self._on_search_loaded(seq, f))
+
+    def _on_search_loaded(self, seq: int, future):
+        """Pass search results to the main thread (runs in the worker thread)."""
+        try:
+            self.root.after(0, self._show_search_results, seq, future)
+        except (tk.TclError, RuntimeError):
+            pass  # Window was closed while loading
+
+    def _show_search_results(self, seq: int, future):
+        """Show the links found by a database search (in main thread)."""
+        if seq != self._search_seq:
+            return  # A newer search or filter superseded this one
+
+        try:
+            links = future.result()
+        except Exception as e:
+            logger.error(f"Error searching links: {e}")
+            self.set_status("Error searching links")
+            return
+
+        self._showing_search_results = True
+        self._listed_base = None  # The base list must be set again afterwards
+        self.link_list.set_links(links)
+        self.link_count_text.set(f"{len(links)} links")
 
     def scan_now(self):
         """Start a browser history scan."""
-        if self.is_scanning:
+        if not self._scan_slot.acquire(blocking=False):
             self.set_status("Scan already in progress")
             return
 
-        self.is_scanning = True
         self.scan_button.config(state='disabled')
         self.set_status("Scanning browser history...")
         self.scan_status_text.set("Scanning...")
 
-        # Run scan in background thread
-        thread = threading.Thread(target=self._run_scan)
-        thread.daemon = True
-        thread.start()
+        # Run scan on the persistent scan worker
+        self._scan_pool.submit(self._run_scan)
 
     def _run_scan(self):
         """Run the actual scan (in background thread)."""
@@ -382,9 +572,12 @@ class MainWindow:
                 # Fallback to regular scan
                 stats = self.tracker.scan_and_update(since_hours=24)  # Last 24 hours for performance
 
-            # Calculate totals
-            total_new = sum(s.get('new', 0) for s in stats.values() if isinstance(s, dict))
-            total_updated = sum(s.get('updated', 0) for s in stats.values() if isinstance(s, dict))
+            # Calculate totals in a single pass
+            total_new = total_updated = 0
+            for s in stats.values():
+                if isinstance(s, dict):
+                    total_new += s.get('new', 0)
+                    total_updated += s.get('updated', 0)
 
             # Update UI in main thread
             self.root.after(0, self._scan_complete, total_new, total_updated)
@@ -395,7 +588,7 @@ class MainWindow:
 
     def _scan_complete(self, new_count: int, updated_count: int):
         """Handle scan completion (in main thread)."""
-        self.is_scanning = False
+        self._scan_slot.release()
         self.scan_button.config(state='normal')
         self.scan_status_text.set(f"Last scan: {datetime.now().strftime('%H:%M')}")
 
@@ -407,7 +600,7 @@ class MainWindow:
 
     def _scan_error(self, error_msg: str):
         """Handle scan error (in main thread)."""
-        self.is_scanning = False
+        self._scan_slot.release()
         self.scan_button.config(state='normal')
         self.scan_status_text.set("")
         self.set_status(f"Scan error: {error_msg}")
@@ -423,8 +616,8 @@ class MainWindow:
 
     def _auto_scan(self):
         """Perform automatic scan."""
-        if not self.is_scanning:
-            self.scan_now()
+        # scan_now skips the run if the previous scan still holds the slot
+        self.scan_now()
         self._schedule_scan()
 
     def on_link_selected(self, link):
@@ -477,12 +670,9 @@ class MainWindow:
 
     def on_category_filter(self, event=None):
         """Handle category filter change."""
-        selected = self.category_combo.get()
-        if selected == "All Categories":
-            self.current_category = None
-        else:
-            self.current_category = selected
-        self.refresh_links()
+        index = self.category_combo.current()
+        self.current_category_id = self._category_ids[index] if index >= 0 else None
+        self._apply_search()  # Reloads only if the category actually changed
 
     def filter_by_days(self, days: Optional[int]):
         """Filter links by time period."""
@@ -495,30 +685,51 @@ class MainWindow:
             self.time_filter_var.set("7 Days")
         elif days == 30:
             self.time_filter_var.set("30 Days")
-        self.refresh_links()
+        self._apply_search()  # Reloads only if the period actually changed
 
     def on_search(self, event=None):
         """Handle search."""
+        self._cancel_live_search()
         self.current_search = self.search_var.get().strip()
-        self.refresh_links()
+        self._apply_search()
 
     def on_search_key(self, event=None):
         """Handle search key press (live search)."""
+        # Restart the timer so only the last keystroke triggers a reload
+        self._cancel_live_search()
+        self.search_timer = self.root.after(SEARCH_DEBOUNCE_MS, self._run_live_search)
+
+    def _run_live_search(self):
+        """Run the debounced live search."""
+        self.search_timer = None
+
         # Only search if more than 2 characters or empty
         search_text = self.search_var.get().strip()
+        if search_text == self.current_search:
+            return  # Nothing changed (e.g. navigation keys or Enter already searched)
         if len(search_text) == 0 or len(search_text) > 2:
             self.current_search = search_text
-            self.refresh_links()
+            self._apply_search()
+
+    def _cancel_live_search(self):
+        """Cancel a pending live search."""
+        if self.search_timer:
+            self.root.after_cancel(self.search_timer)
+            self.search_timer = None
 
     def clear_search(self):
         """Clear search and filters."""
+        self._cancel_live_search()
         self.search_var.set("")
         self.current_search = ""
-        self.current_category = None
+        self.current_category_id = None
         self.current_days_filter = None
+        # Programmatic set() does not fire the combobox/radiobutton callbacks,
+        # so this is the only refresh; reuse the cached base list when the
+        # category/day filters were already clear
         self.category_combo.set("All Categories")
         self.time_filter_var.set("All")
-        self.refresh_links()
+        self._apply_search()
 
     def focus_search(self):
         """Focus on search entry (Ctrl+F shortcut)."""
@@ -552,6 +763,7 @@ class MainWindow:
 
     def show_category_dialog(self):
         """Show category management dialog."""
+        from gui.category_dialog import CategoryDialog
         dialog = CategoryDialog(self.root, self.db_manager)
         self.root.wait_window(dialog.dialog)
 
@@ -561,6 +773,7 @@ class MainWindow:
 
     def show_trash_dialog(self):
         """Show trash/recycle bin dialog."""
+        from gui.trash_dialog import TrashDialog
         dialog = TrashDialog(self.root, self.db_manager, on_restore=self.refresh_links)
         self.root.wait_window(dialog.dialog)
 
@@ -572,6 +785,7 @@ class MainWindow:
 
     def show_preferences(self):
         """Show preferences dialog."""
+        from gui.settings_dialog import SettingsDialog
         SettingsDialog(self.root, self.settings_manager)
 
     def export_data(self):
@@ -586,12 +800,24 @@ class MainWindow:
 
         if filename:
             try:
-                data = self.db_manager.export_to_dict()
+                data = self.db_manager.export_metadata()
+                link_count = 0
                 with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                    # Write the small sections up front, then stream links
+                    # row by row so the full export is never held in memory
+                    f.write('{\n')
+                    for key, value in data.items():
+                        f.write(f'  {json.dumps(key)}: ')
+                        f.write(json.dumps(value, ensure_ascii=False))
+                        f.write(',\n')
+                    f.write('  "links": [')
+                    for link_data in self.db_manager.iter_export_links():
+                        f.write(',\n    ' if link_count else '\n    ')
+                        f.write(json.dumps(link_data, ensure_ascii=False))
+                        link_count += 1
+                    f.write('\n  ]\n}\n')
 
                 # Show statistics
-                link_count = len(data.get('links', []))
                 category_count = len(data.get('categories', []))
                 tag_count = len(data.get('tags', []))
 
@@ -690,9 +916,13 @@ browsing history across multiple browsers.
         # Cancel scan timer
         if self.scan_timer:
             self.root.after_cancel(self.scan_timer)
+        self._cancel_live_search()
+        self._query_executor.shutdown(wait=False)
+        self._scan_pool.shutdown(wait=False)
 
         # Save window geometry
         self.config.set('window_geometry', self.root.geometry())
+        self.config.flush()
 
         # Close database
         self.db_manager.close()
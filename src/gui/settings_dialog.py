@@ -34,8 +34,12 @@ class SettingsDialog:
         self.original_settings = settings_manager.get_all()
         self.changed = False
 
-        self._create_widgets()
+        # Setting values, plus Tk variables only for the tabs built so far
+        self._values = {}
+        self._vars = {}
+
         self._load_settings()
+        self._create_widgets()
 
         # Position dialog
         self.dialog.geometry("500x400")
@@ -56,14 +60,18 @@ class SettingsDialog:
         self.notebook = ttk.Notebook(self.dialog)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        # General tab
-        self._create_general_tab()
+        # Add empty tab frames; each tab's widgets are built the first time
+        # it is shown, so opening the dialog only builds the General tab
+        self._tab_builders = {}
+        for text, builder in (("General", self._create_general_tab),
+                              ("Browser", self._create_browser_tab),
+                              ("Display", self._create_display_tab)):
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=text)
+            self._tab_builders[str(frame)] = (frame, builder)
 
-        # Browser tab
-        self._create_browser_tab()
-
-        # Display tab
-        self._create_display_tab()
+        self._build_selected_tab()
+        self.notebook.bind('<<NotebookTabChanged>>', lambda e: self._build_selected_tab())
 
         # Button frame
         button_frame = ttk.Frame(self.dialog)
@@ -93,20 +101,41 @@ class SettingsDialog:
             command=self._on_reset
         ).pack(side=tk.LEFT)
 
-    def _create_general_tab(self):
-        """Create general settings tab."""
-        general_frame = ttk.Frame(self.notebook)
-        self.notebook.add(general_frame, text="General")
+    def _variable(self, key: str, var_type):
+        """Create the Tk variable for a setting, initialized from its loaded value.
+
+        Args:
+            key: Settings key
+            var_type: Tk variable class (BooleanVar, IntVar, StringVar)
+
+        Returns:
+            The new variable
+        """
+        var = var_type(value=self._values[key])
+        self._vars[key] = var
+        return var
+
+    def _build_selected_tab(self):
+        """Build the widgets of the selected tab if it has not been built yet."""
+        entry = self._tab_builders.pop(self.notebook.select(), None)
+        if entry:
+            frame, builder = entry
+            builder(frame)
+
+    def _create_general_tab(self, general_frame):
+        """Create general settings tab.
 
+        Args:
+            general_frame: Notebook frame to build the tab in
+        """
         # Auto scan settings
         scan_frame = ttk.LabelFrame(general_frame, text="Auto Scan", padding=10)
         scan_frame.pack(fill=tk.X, padx=10, pady=(10, 5))
 
-        self.auto_scan_var = tk.BooleanVar()
         ttk.Checkbutton(
             scan_frame,
             text="Enable automatic scanning",
-            variable=self.auto_scan_var,
+            variable=self._variable('auto_scan_enabled', tk.BooleanVar),
             command=self._on_setting_changed
         ).pack(anchor=tk.W)
 
@@ -114,12 +143,11 @@ class SettingsDialog:
         interval_frame.pack(fill=tk.X, pady=(5, 0))
 
         ttk.Label(interval_frame, text="Scan interval:").pack(side=tk.LEFT)
-        self.scan_interval_var = tk.IntVar()
         ttk.Spinbox(
             interval_frame,
             from_=10,
             to=3600,
-            textvariable=self.scan_interval_var,
+            textvariable=self._variable('auto_scan_interval', tk.IntVar),
             width=10,
             command=self._on_setting_changed
         ).pack(side=tk.LEFT, padx=(5, 0))
@@ -129,19 +157,17 @@ class SettingsDialog:
         startup_frame = ttk.LabelFrame(general_frame, text="Startup", padding=10)
         startup_frame.pack(fill=tk.X, padx=10, pady=5)
 
-        self.start_minimized_var = tk.BooleanVar()
         ttk.Checkbutton(
             startup_frame,
             text="Start minimized",
-            variable=self.start_minimized_var,
+            variable=self._variable('start_minimized', tk.BooleanVar),
             command=self._on_setting_changed
         ).pack(anchor=tk.W)
 
-        self.minimize_to_tray_var = tk.BooleanVar()
         ttk.Checkbutton(
             startup_frame,
             text="Minimize to system tray",
-            variable=self.minimize_to_tray_var,
+            variable=self._variable('minimize_to_tray', tk.BooleanVar),
             command=self._on_setting_changed,
             state='disabled'  # Not implemented yet
         ).pack(anchor=tk.W)
@@ -150,19 +176,19 @@ class SettingsDialog:
         behavior_frame = ttk.LabelFrame(general_frame, text="Behavior", padding=10)
         behavior_frame.pack(fill=tk.X, padx=10, pady=5)
 
-        self.confirm_delete_var = tk.BooleanVar()
         ttk.Checkbutton(
             behavior_frame,
             text="Confirm before deleting links",
-            variable=self.confirm_delete_var,
+            variable=self._variable('confirm_delete', tk.BooleanVar),
             command=self._on_setting_changed
         ).pack(anchor=tk.W)
 
-    def _create_browser_tab(self):
-        """Create browser settings tab."""
-        browser_frame = ttk.Frame(self.notebook)
-        self.notebook.add(browser_frame, text="Browser")
+    def _create_browser_tab(self, browser_frame):
+        """Create browser settings tab.
 
+        Args:
+            browser_frame: Notebook frame to build the tab in
+        """
         # Default browser selection
         default_frame = ttk.LabelFrame(browser_frame, text="Default Browser", padding=10)
         default_frame.pack(fill=tk.X, padx=10, pady=(10, 5))
@@ -172,28 +198,50 @@ class SettingsDialog:
             text="Choose the browser to use when double-clicking links:"
         ).pack(anchor=tk.W, pady=(0, 10))
 
-        # Get available browsers
-        self.browser_var = tk.StringVar()
+        # Browser choices, filled by _fill_browser_lists
+        self._variable('default_browser', tk.StringVar)
+        self._browser_choices = ttk.Frame(default_frame)
+        self._browser_choices.pack(fill=tk.X)
+
+        # Browser detection info
+        info_frame = ttk.LabelFrame(browser_frame, text="Detected Browsers", padding=10)
+        info_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        ttk.Button(
+            info_frame,
+            text="Refresh",
+            command=self._refresh_browsers
+        ).pack(side=tk.BOTTOM, anchor=tk.E, pady=(5, 0))
+
+        # Create text widget for browser info
+        self._browser_info = tk.Text(info_frame, height=8, width=50, wrap=tk.WORD)
+        self._browser_info.pack(fill=tk.BOTH, expand=True)
+
+        self._fill_browser_lists()
+
+    def _fill_browser_lists(self):
+        """Show the detected browsers in the Browser tab."""
+        # Get available browsers (cached after the first detection)
         browsers = self.browser_manager.get_browser_list()
+        browser_var = self._vars['default_browser']
+
+        for child in self._browser_choices.winfo_children():
+            child.destroy()
 
         for browser_id, browser_name in browsers:
             ttk.Radiobutton(
-                default_frame,
+                self._browser_choices,
                 text=browser_name,
-                variable=self.browser_var,
+                variable=browser_var,
                 value=browser_id,
                 command=self._on_setting_changed
             ).pack(anchor=tk.W, pady=2)
 
-        # Browser detection info
-        info_frame = ttk.LabelFrame(browser_frame, text="Detected Browsers", padding=10)
-        info_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-
-        # Create text widget for browser info
-        info_text = tk.Text(info_frame, height=8, width=50, wrap=tk.WORD)
-        info_text.pack(fill=tk.BOTH, expand=True)
-
         # Show detected browsers
+        info_text = self._browser_info
+        info_text.config(state='normal')
+        info_text.delete('1.0', 'end')
+
         detected = self.browser_manager.detect_installed_browsers()
         info_text.insert('1.0', "The following browsers were detected on your system:\n\n")
 
@@ -205,20 +253,25 @@ class SettingsDialog:
 
         info_text.config(state='disabled')
 
-    def _create_display_tab(self):
-        """Create display settings tab."""
-        display_frame = ttk.Frame(self.notebook)
-        self.notebook.add(display_frame, text="Display")
+    def _refresh_browsers(self):
+        """Detect browsers again, e.g. after one was installed while the app runs."""
+        BrowserManager.invalidate()
+        self._fill_browser_lists()
 
+    def _create_display_tab(self, display_frame):
+        """Create display settings tab.
+
+        Args:
+            display_frame: Notebook frame to build the tab in
+        """
         # Display options
         options_frame = ttk.LabelFrame(display_frame, text="Display Options", padding=10)
         options_frame.pack(fill=tk.X, padx=10, pady=(10, 5))
 
-        self.show_favicon_var = tk.BooleanVar()
         ttk.Checkbutton(
             options_frame,
             text="Show website favicons",
-            variable=self.show_favicon_var,
+            variable=self._variable('show_favicon', tk.BooleanVar),
             command=self._on_setting_changed,
             state='disabled'  # Not implemented yet
         ).pack(anchor=tk.W)
@@ -231,13 +284,12 @@ class SettingsDialog:
         limit_frame.pack(fill=tk.X)
 
         ttk.Label(limit_frame, text="Maximum links to display:").pack(side=tk.LEFT)
-        self.max_links_var = tk.IntVar()
         ttk.Spinbox(
             limit_frame,
             from_=100,
             to=10000,
             increment=100,
-            textvariable=self.max_links_var,
+            textvariable=self._variable('max_links_display', tk.IntVar),
             width=10,
             command=self._on_setting_changed
         ).pack(side=tk.LEFT, padx=(5, 0))
@@ -247,10 +299,9 @@ class SettingsDialog:
         theme_frame.pack(fill=tk.X, padx=10, pady=5)
 
         ttk.Label(theme_frame, text="Theme:").pack(side=tk.LEFT)
-        self.theme_var = tk.StringVar()
         theme_combo = ttk.Combobox(
             theme_frame,
-            textvariable=self.theme_var,
+            textvariable=self._variable('theme', tk.StringVar),
             values=['default', 'clam', 'alt', 'classic'],
             state='readonly',
             width=15
@@ -260,40 +311,32 @@ class SettingsDialog:
 
     def _load_settings(self):
         """Load current settings into UI."""
-        # General settings
-        self.auto_scan_var.set(self.settings_manager.get('auto_scan_enabled', True))
-        self.scan_interval_var.set(self.settings_manager.get('auto_scan_interval', 60))
-        self.start_minimized_var.set(self.settings_manager.get('start_minimized', False))
-        self.minimize_to_tray_var.set(self.settings_manager.get('minimize_to_tray', False))
-        self.confirm_delete_var.set(self.settings_manager.get('confirm_delete', True))
-
-        # Browser settings
-        self.browser_var.set(self.settings_manager.get('default_browser', 'system'))
+        self._values = {
+            key: self.settings_manager.get(key, default)
+            for key, default in SettingsManager.DEFAULT_SETTINGS.items()
+        }
 
-        # Display settings
-        self.show_favicon_var.set(self.settings_manager.get('show_favicon', True))
-        self.max_links_var.set(self.settings_manager.get('max_links_display', 1000))
-        self.theme_var.set(self.settings_manager.get('theme', 'default'))
+        # Refresh the widgets of tabs that were already built
+        for key, var in self._vars.items():
+            var.set(self._values[key])
 
     def _save_settings(self):
         """Save current UI values to settings."""
-        # General settings
-        self.settings_manager.set('auto_scan_enabled', self.auto_scan_var.get())
-        self.settings_manager.set('auto_scan_interval', self.scan_interval_var.get())
-        self.settings_manager.set('start_minimized', self.start_minimized_var.get())
-        self.settings_manager.set('minimize_to_tray', self.minimize_to_tray_var.get())
-        self.settings_manager.set('confirm_delete', self.confirm_delete_var.get())
-
-        # Browser settings
-        self.settings_manager.set('default_browser', self.browser_var.get())
-
-        # Display settings
-        self.settings_manager.set('show_favicon', self.show_favicon_var.get())
-        self.settings_manager.set('max_links_display', self.max_links_var.get())
-        self.settings_manager.set('theme', self.theme_var.get())
+        # Tabs that were never shown keep their loaded values
+        for key, var in self._vars.items():
+            self._values[key] = var.get()
+
+        # Keep memory in sync (Reset may have changed it), but only touch
+        # the file when something differs from what was saved
+        self.settings_manager.update(self._values)
+        diff = {key: value for key, value in self._values.items()
+                if self.original_settings.get(key) != value}
+        if not diff:
+            return
 
         # Save to file
-        self.settings_manager.save()
+        if self.settings_manager.save():
+            self.original_settings.update(diff)
 
     def _on_setting_changed(self):
         """Called when any setting is changed."""
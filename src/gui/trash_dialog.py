@@ -6,9 +6,20 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Optional, Callable
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 from database.db_manager import DatabaseManager
 from database.models import Link
+from gui.tree_utils import register_bulk_insert, bulk_insert
+
+# Delay before live search runs, so typing doesn't query on every keystroke
+SEARCH_DEBOUNCE_MS = 300
+
+# Deleted links loaded per query; more pages load when scrolled to the end
+TRASH_PAGE_SIZE = 500
+
+# Icon shown in the tree column of every row
+TRASH_ICON = '🗑️'
 
 
 class TrashDialog:
@@ -26,6 +37,16 @@ class TrashDialog:
         self.on_restore = on_restore
         self.selected_links = []
 
+        # Paging state for the deleted links query
+        self._query = None
+        self._loaded_count = 0
+        self._has_more = False
+        self._query_seq = 0
+        self._search_timer = None
+
+        # Worker for the page queries, so typing and scrolling never block
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("🗑️ Recycle Bin - Deleted Links")
@@ -47,6 +68,13 @@ class TrashDialog:
 
         # Bind ESC to close dialog
         self.dialog.bind('<Escape>', lambda e: self.dialog.destroy())
+        self.dialog.bind('<Destroy>', self._on_destroy)
+
+    def _on_destroy(self, event):
+        """Stop the worker and pending search when the dialog closes."""
+        if event.widget is self.dialog:
+            self._cancel_search_timer()
+            self._executor.shutdown(wait=False)
 
     def _build_ui(self):
         """Build the UI components."""
@@ -92,12 +120,13 @@ class TrashDialog:
         self.search_var = tk.StringVar()
         self.search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=40)
         self.search_entry.pack(side=tk.LEFT, padx=(0, 5))
-        self.search_entry.bind('<Return>', lambda e: self._search())
+        self.search_entry.bind('<Return>', lambda e: self._load_deleted_links())
+        self.search_entry.bind('<KeyRelease>', self._on_search_key)
 
         ttk.Button(
             search_frame,
             text="🔍 Search",
-            command=self._search
+            command=self._load_deleted_links
         ).pack(side=tk.LEFT)
 
         # Treeview for deleted links
@@ -106,6 +135,7 @@ class TrashDialog:
 
         # Scrollbars
         vsb = ttk.Scrollbar(tree_frame, orient="vertical")
+        self.vsb = vsb
         hsb = ttk.Scrollbar(tree_frame, orient="horizontal")
 
         # Create treeview
@@ -114,7 +144,7 @@ class TrashDialog:
             tree_frame,
             columns=columns,
             show='tree headings',
-            yscrollcommand=vsb.set,
+            yscrollcommand=self._on_tree_yscroll,
             xscrollcommand=hsb.set,
             selectmode='extended'  # Allow multiple selection
         )
@@ -147,6 +177,9 @@ class TrashDialog:
         # Bind double-click to restore
         self.tree.bind('<Double-Button-1>', lambda e: self._restore_selected())
 
+        # Register the bulk insert helper with the Tcl interpreter
+        register_bulk_insert(self.tree)
+
         # Bottom button frame
         bottom_frame = ttk.Frame(container)
         bottom_frame.pack(fill=tk.X)
@@ -164,94 +197,157 @@ class TrashDialog:
         ).pack(side=tk.RIGHT)
 
     def _load_deleted_links(self):
-        """Load only deleted links from database efficiently."""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        # Get ONLY deleted links using optimized query
-        deleted_links = self.db_manager.get_links(include_deleted='only')
+        """Load deleted links matching the current search text.
 
-        # Update info label
-        self.info_label.config(text=f"Found {len(deleted_links)} deleted links")
+        Used for the initial load, Search, Refresh and after restore/delete,
+        so every path keeps the active filter.
+        """
+        self._cancel_search_timer()
+        query = self.search_var.get().strip()
+        self._show_deleted_links(query or None)
+        self.selected_links = []
 
-        # Add to treeview
-        for link in deleted_links:
-            # Format deleted date
-            if link.deleted_at:
-                deleted_str = link.deleted_at.strftime('%Y-%m-%d %H:%M')
-            else:
-                deleted_str = 'Unknown'
+    def _on_search_key(self, event=None):
+        """Restart the live search timer after a keystroke."""
+        self._cancel_search_timer()
+        self._search_timer = self.dialog.after(SEARCH_DEBOUNCE_MS, self._run_live_search)
 
-            # Insert into tree
-            item_id = self.tree.insert(
-                '',
-                'end',
-                text='🗑️',
-                values=(
-                    link.title or link.url,
-                    link.url,
-                    deleted_str,
-                    link.access_count
-                ),
-                tags=(link.id,)  # Store link ID in tags
-            )
+    def _run_live_search(self):
+        """Run the debounced live search if the search text changed."""
+        self._search_timer = None
+        query = self.search_var.get().strip() or None
+        if query != self._query:
+            self._show_deleted_links(query)
 
-        self.selected_links = []
+    def _cancel_search_timer(self):
+        """Cancel a pending live search."""
+        if self._search_timer:
+            self.dialog.after_cancel(self._search_timer)
+            self._search_timer = None
 
-    def _search(self):
-        """Search for deleted links efficiently."""
-        query = self.search_var.get().strip()
+    def _show_deleted_links(self, query: Optional[str]):
+        """Show the first page of deleted links; later pages load on scroll.
 
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        The first page and the total are queried in a background thread.
 
-        # Get ONLY deleted links with search (optimized)
-        deleted_links = self.db_manager.get_links(
-            search_query=query if query else None,
-            include_deleted='only'
-        )
+        Args:
+            query: Search text, or None for all deleted links
+        """
+        self._query = query
+        self._has_more = False  # No scroll loads until the new first page is in
+        self._query_seq += 1
+        seq = self._query_seq
+
+        future = self._executor.submit(self._query_first_page, query)
+        future.add_done_callback(lambda f: self._on_first_page_loaded(seq, f))
+
+    def _query_first_page(self, query: Optional[str]):
+        """Count matching deleted links and fetch the first page (in worker thread)."""
+        total = self.db_manager.count_deleted_links(query)
+        return total, self._fetch_page(query, 0)
+
+    def _on_first_page_loaded(self, seq: int, future):
+        """Pass the first page to the main thread (runs in the worker thread)."""
+        try:
+            self.dialog.after(0, self._show_first_page, seq, future)
+        except (tk.TclError, RuntimeError):
+            pass  # Dialog was closed while loading
+
+    def _show_first_page(self, seq: int, future):
+        """Replace the tree contents with a loaded first page (in main thread)."""
+        if seq != self._query_seq or not self.dialog.winfo_exists():
+            return  # Superseded by a newer search, or dialog closed
+
+        try:
+            total, links = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load deleted links: {e}", parent=self.dialog)
+            return
 
         # Update info label
-        if query:
-            self.info_label.config(text=f"Found {len(deleted_links)} deleted links matching '{query}'")
+        if self._query:
+            self.info_label.config(text=f"Found {total} deleted links matching '{self._query}'")
         else:
-            self.info_label.config(text=f"Found {len(deleted_links)} deleted links")
+            self.info_label.config(text=f"Found {total} deleted links")
+
+        # Clear existing items in one call
+        self.tree.delete(*self.tree.get_children())
+        self._loaded_count = 0
+        self._insert_rows(links)
+
+    def _fetch_page(self, query: Optional[str], offset: int):
+        """Query one page of deleted links."""
+        # Get ONLY deleted links (optimized)
+        return self.db_manager.get_links(
+            search_query=query,
+            include_deleted='only',
+            limit=TRASH_PAGE_SIZE,
+            offset=offset
+        )
+
+    def _load_next_page(self):
+        """Query the next page of deleted links in the background."""
+        seq = self._query_seq
+        future = self._executor.submit(self._fetch_page, self._query, self._loaded_count)
+        future.add_done_callback(lambda f: self._on_next_page_loaded(seq, f))
+
+    def _on_next_page_loaded(self, seq: int, future):
+        """Pass a loaded page to the main thread (runs in the worker thread)."""
+        try:
+            self.dialog.after(0, self._append_page, seq, future)
+        except (tk.TclError, RuntimeError):
+            pass  # Dialog was closed while loading
+
+    def _append_page(self, seq: int, future):
+        """Append a loaded page to the tree (in main thread)."""
+        if seq != self._query_seq or not self.dialog.winfo_exists():
+            return  # Superseded by a newer search, or dialog closed
+
+        try:
+            links = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load deleted links: {e}", parent=self.dialog)
+            return
+
+        self._insert_rows(links)
 
-        # Add to treeview
-        for link in deleted_links:
-            # Format deleted date
-            if link.deleted_at:
-                deleted_str = link.deleted_at.strftime('%Y-%m-%d %H:%M')
+    def _insert_rows(self, links):
+        """Append links to the tree and update the paging state.
+
+        Args:
+            links: Page of deleted links
+        """
+        self._loaded_count += len(links)
+        self._has_more = len(links) == TRASH_PAGE_SIZE
+
+        # Build all rows, then insert them in one Tcl call
+        rows = []
+        add_row = rows.append
+        for link in links:
+            # Format deleted date (f-string avoids strftime's per-call format parsing)
+            d = link.deleted_at
+            if d:
+                deleted_str = f"{d.year:04d}-{d.month:02d}-{d.day:02d} {d.hour:02d}:{d.minute:02d}"
             else:
                 deleted_str = 'Unknown'
 
-            # Insert into tree
-            self.tree.insert(
-                '',
-                'end',
-                text='🗑️',
-                values=(
-                    link.title or link.url,
-                    link.url,
-                    deleted_str,
-                    link.access_count
-                ),
-                tags=(link.id,)
-            )
+            add_row(TRASH_ICON)
+            add_row((link.title or link.url, link.url, deleted_str, link.access_count))
+            add_row(link.id)  # Link ID becomes the item id
 
-    def _get_selected_link_ids(self):
-        """Get IDs of selected links."""
-        selected_items = self.tree.selection()
-        link_ids = []
+        bulk_insert(self.tree, ('-text', '-values', '-id'), rows)
 
-        for item in selected_items:
-            tags = self.tree.item(item)['tags']
-            if tags:
-                link_ids.append(tags[0])
+    def _on_tree_yscroll(self, first, last):
+        """Update the scrollbar and load more rows once the end is visible."""
+        self.vsb.set(first, last)
+        if self._has_more and float(last) >= 1.0:
+            self._has_more = False  # Load each page only once
+            self._load_next_page()
 
-        return link_ids
+    def _get_selected_link_ids(self):
+        """Get IDs of selected links."""
+        # Item ids are the link IDs, so no per-item lookups are needed
+        return [int(item) for item in self.tree.selection()]
 
     def _restore_selected(self):
         """Restore selected links using batch operation."""
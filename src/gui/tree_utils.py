@@ -0,0 +1,52 @@
+"""
+Helpers shared by the Treeview-based widgets.
+"""
+
+from tkinter import ttk
+from typing import Sequence
+
+# Tcl helper that inserts many rows with a single Python->Tcl call.
+# Takes the option names given for every row (e.g. -values -tags) and a flat
+# list holding one value per option for each row; returns the new item IDs.
+# Rows whose -id is already in the tree are skipped, in case paging overlaps.
+BULK_INSERT_PROC = '::linktracker_bulk_insert'
+BULK_INSERT_SCRIPT = """
+proc %s {tree options rows} {
+    set count [llength $options]
+    set items {}
+    for {set i 0} {$i < [llength $rows]} {incr i $count} {
+        set args {}
+        foreach option $options value [lrange $rows $i [expr {$i + $count - 1}]] {
+            lappend args $option $value
+        }
+        if {[dict exists $args -id] && [$tree exists [dict get $args -id]]} {
+            continue
+        }
+        lappend items [$tree insert {} end {*}$args]
+    }
+    return $items
+}
+""" % BULK_INSERT_PROC
+
+
+def register_bulk_insert(tree: ttk.Treeview):
+    """Register the bulk insert helper with the tree's Tcl interpreter.
+
+    Args:
+        tree: Treeview that will use bulk_insert
+    """
+    tree.tk.eval(BULK_INSERT_SCRIPT)
+
+
+def bulk_insert(tree: ttk.Treeview, options: Sequence[str], rows: list) -> tuple:
+    """Insert rows at the end of a tree in one Tcl call.
+
+    Args:
+        tree: Treeview registered with register_bulk_insert
+        options: Item option names set for every row, e.g. ('-values', '-tags')
+        rows: Flat list with one value per option for each row
+
+    Returns:
+        IDs of the inserted items
+    """
+    return tree.tk.splitlist(tree.tk.call(BULK_INSERT_PROC, str(tree), tuple(options), tuple(rows)))
@@ -6,6 +6,7 @@ Personal link management tool that tracks browsing history across multiple brows
 import sys
 import os
 import logging
+import logging.handlers
 from pathlib import Path
 
 # Add src directory to Python path for imports
@@ -21,18 +22,25 @@ else:
 sys.path.insert(0, str(base_path))
 
 
-def setup_logging():
-    """Configure logging for the application."""
-    log_dir = Path('logs') if os.environ.get('LINK_TRACKER_DEV') else Path(os.environ.get('APPDATA', '.')) / 'LinkTracker' / 'logs'
-    log_dir.mkdir(parents=True, exist_ok=True)
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
-    log_file = log_dir / 'linktracker.log'
+
+def setup_logging() -> logging.handlers.MemoryHandler:
+    """Configure logging for the application.
+
+    Records are buffered in memory until open_log_file() is called, so
+    creating the log directory and file does not delay the first window.
+
+    Returns:
+        The buffering handler to pass to open_log_file()
+    """
+    log_buffer = logging.handlers.MemoryHandler(capacity=1000)
 
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format=LOG_FORMAT,
         handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
+            log_buffer,
             logging.StreamHandler()
         ]
     )
@@ -41,15 +49,48 @@ def setup_logging():
     logger.info("=" * 60)
     logger.info("Browser Link Tracker starting...")
     logger.info(f"Python version: {sys.version}")
-    logger.info(f"Log file: {log_file}")
     logger.info("=" * 60)
 
+    return log_buffer
+
+
+def open_log_file(log_buffer: logging.handlers.MemoryHandler):
+    """Open the log file and write out everything buffered so far.
+
+    Args:
+        log_buffer: Handler returned by setup_logging()
+    """
+    root_logger = logging.getLogger()
+    if log_buffer not in root_logger.handlers:
+        return  # Already opened
+
+    if os.environ.get('LINK_TRACKER_DEV'):
+        log_dir = Path('logs')
+    else:
+        log_dir = Path(os.environ.get('APPDATA', '.')) / 'LinkTracker' / 'logs'
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    log_file = log_dir / 'linktracker.log'
+
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    root_logger.addHandler(file_handler)
+
+    # Flush the startup records to the file, then log directly
+    root_logger.removeHandler(log_buffer)
+    log_buffer.setTarget(file_handler)
+    log_buffer.close()
+
+    logging.getLogger(__name__).info(f"Log file: {log_file}")
+
 
 def main():
     """Main application entry point."""
+    log_buffer = None
+    app = None
     try:
         # Setup logging
-        setup_logging()
+        log_buffer = setup_logging()
         logger = logging.getLogger(__name__)
 
         # Import after logging is configured
@@ -59,36 +100,73 @@ def main():
         logger.info("Creating main window...")
         app = MainWindow()
 
+        # Open the log file once the window is up
+        app.root.after_idle(open_log_file, log_buffer)
+
         logger.info("Starting GUI event loop...")
         app.run()
 
         logger.info("Application closed normally")
 
     except ImportError as e:
+        if log_buffer is not None:
+            open_log_file(log_buffer)
         logger.error(f"Import error: {e}")
         logger.error("Please ensure all dependencies are installed:")
         logger.error("  pip install -r requirements.txt")
         sys.exit(1)
 
     except Exception as e:
+        if log_buffer is not None:
+            open_log_file(log_buffer)
         logger.error(f"Unexpected error: {e}", exc_info=True)
 
-        # Show error dialog if tkinter is available
+        show_error_dialog(
+            f"An unexpected error occurred:\n\n{e}\n\nPlease check the log file for details.",
+            app
+        )
+        sys.exit(1)
+
+
+def show_error_dialog(message: str, app=None):
+    """Show a fatal error without paying for a second Tk initialization.
+
+    Reuses the main window's Tk root if it still exists, otherwise uses the
+    native Windows message box, and only creates a new Tk root as a last resort.
+
+    Args:
+        message: Error text to show
+        app: MainWindow instance, if it was created
+    """
+    try:
+        from tkinter import messagebox
+
+        if app is not None and app.root.winfo_exists():
+            messagebox.showerror("Error", message, parent=app.root)
+            return
+    except Exception:
+        pass  # Root already destroyed
+
+    if os.name == 'nt':
         try:
-            import tkinter as tk
-            from tkinter import messagebox
-
-            root = tk.Tk()
-            root.withdraw()
-            messagebox.showerror(
-                "Error",
-                f"An unexpected error occurred:\n\n{e}\n\nPlease check the log file for details."
-            )
-            root.destroy()
-        except:
+            import ctypes
+            MB_ICONERROR = 0x10
+            ctypes.windll.user32.MessageBoxW(0, message, "Error", MB_ICONERROR)
+            return
+        except Exception:
             pass
 
-        sys.exit(1)
+    # Show error dialog if tkinter is available
+    try:
+        import tkinter as tk
+        from tkinter import messagebox
+
+        root = tk.Tk()
+        root.withdraw()
+        messagebox.showerror("Error", message)
+        root.destroy()
+    except:
+        pass
 
 
 if __name__ == "__main__":
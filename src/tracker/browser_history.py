@@ -4,18 +4,32 @@ Reads Chrome/Edge history databases and extracts visited URLs.
 """
 
 import sqlite3
-import shutil
-import tempfile
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 import logging
-from contextlib import contextmanager
+from functools import lru_cache
 
 from tracker.browser_paths import BrowserProfile, BrowserPathFinder
+from tracker.history_db import HistoryEntry, history_changed_since, open_history_copy
 
 logger = logging.getLogger(__name__)
 
+# Visits newest first; binds the minimum Chrome timestamp (0 for all) and a
+# LIMIT (-1 for none)
+HISTORY_QUERY = """
+    SELECT
+        urls.url,
+        COALESCE(NULLIF(urls.title, ''), urls.url) AS title,
+        urls.visit_count,
+        visits.visit_time
+    FROM visits
+    JOIN urls ON urls.id = visits.url
+    WHERE urls.hidden = 0 AND visits.visit_time >= ?
+    ORDER BY visits.visit_time DESC
+    LIMIT ?
+"""
+
 
 class BrowserHistoryScanner:
     """Scans browser history databases for visited URLs."""
@@ -34,7 +48,7 @@ class BrowserHistoryScanner:
 
     def scan_browser_profile(self, profile: BrowserProfile,
                            since: Optional[datetime] = None,
-                           limit: Optional[int] = None) -> List[Dict]:
+                           limit: Optional[int] = None) -> List[HistoryEntry]:
         """Scan a specific browser profile's history.
 
         Args:
@@ -43,18 +57,18 @@ class BrowserHistoryScanner:
             limit: Maximum number of results
 
         Returns:
-            List of dictionaries with URL data
+            List of HistoryEntry records
         """
         if not profile.is_valid():
             logger.warning(f"Invalid profile: {profile}")
             return []
 
         # Copy the database to avoid locking issues
-        with self._get_temp_db_copy(profile.history_db_path) as temp_db_path:
-            return self._read_history_db(temp_db_path, profile, since, limit)
+        with open_history_copy(profile.history_db_path) as conn:
+            return self._read_history_db(conn, profile, since, limit)
 
     def scan_all_profiles(self, since: Optional[datetime] = None,
-                         limit: Optional[int] = None) -> Dict[str, List[Dict]]:
+                         limit: Optional[int] = None) -> Dict[str, List[HistoryEntry]]:
         """Scan all discovered browser profiles.
 
         Args:
@@ -80,98 +94,44 @@ class BrowserHistoryScanner:
 
         return results
 
-    @contextmanager
-    def _get_temp_db_copy(self, db_path: Path):
-        """Create a temporary copy of the database to avoid lock issues.
-
-        Args:
-            db_path: Path to the original database
-
-        Yields:
-            Path to temporary database copy
-        """
-        temp_file = None
-        try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tf:
-                temp_file = Path(tf.name)
-
-            # Copy the database
-            shutil.copy2(db_path, temp_file)
-            yield temp_file
-
-        finally:
-            # Clean up temporary file
-            if temp_file and temp_file.exists():
-                try:
-                    temp_file.unlink()
-                except Exception as e:
-                    logger.warning(f"Could not delete temp file {temp_file}: {e}")
-
-    def _read_history_db(self, db_path: Path, profile: BrowserProfile,
+    def _read_history_db(self, conn: sqlite3.Connection, profile: BrowserProfile,
                         since: Optional[datetime] = None,
-                        limit: Optional[int] = None) -> List[Dict]:
+                        limit: Optional[int] = None) -> List[HistoryEntry]:
         """Read history from a Chrome/Edge SQLite database.
 
         Args:
-            db_path: Path to the database file
+            conn: Open connection to the history database
             profile: BrowserProfile information
             since: Only get URLs visited after this time
             limit: Maximum number of results
 
         Returns:
-            List of dictionaries with URL data
+            List of HistoryEntry records
         """
-        conn = sqlite3.connect(str(db_path))
-        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
         try:
-            # Build the query
-            query = """
-                SELECT
-                    urls.url,
-                    urls.title,
-                    urls.visit_count,
-                    visits.visit_time,
-                    visits.id as visit_id
-                FROM urls
-                JOIN visits ON urls.id = visits.url
-            """
-
-            params = []
-
-            # Add time filter if specified
-            if since:
-                # Convert datetime to Chrome timestamp
-                chrome_timestamp = self._datetime_to_chrome_timestamp(since)
-                query += " WHERE visits.visit_time >= ?"
-                params.append(chrome_timestamp)
-
-            # Order by most recent first
-            query += " ORDER BY visits.visit_time DESC"
-
-            # Add limit if specified
-            if limit:
-                query += " LIMIT ?"
-                params.append(limit)
-
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-
-            # Convert to list of dictionaries
+            # Constant SQL, so SQLite's statement cache can reuse the plan
+            since_timestamp = self._datetime_to_chrome_timestamp(since) if since else 0
+            cursor.execute(HISTORY_QUERY, (since_timestamp, limit or -1))
+
+            # Same for every row; each record shares these two strings
+            browser = profile.browser
+            profile_name = profile.profile_name
+            to_datetime = self._chrome_timestamp_to_datetime
+
+            # Convert to HistoryEntry records, streaming rows from the
+            # cursor instead of materializing them all first
             results = []
-            for row in rows:
-                visited_at = self._chrome_timestamp_to_datetime(row['visit_time'])
-
-                results.append({
-                    'url': row['url'],
-                    'title': row['title'] or row['url'],
-                    'visit_count': row['visit_count'],
-                    'visited_at': visited_at,
-                    'browser': profile.browser,
-                    'profile': profile.profile_name
-                })
+            for url, title, visit_count, visit_time in cursor:
+                results.append(HistoryEntry(
+                    url,
+                    title,
+                    visit_count,
+                    to_datetime(visit_time),
+                    browser,
+                    profile_name
+                ))
 
             return results
 
@@ -179,25 +139,25 @@ class BrowserHistoryScanner:
             logger.error(f"Error reading history database: {e}")
             return []
 
-        finally:
-            conn.close()
-
     def _chrome_timestamp_to_datetime(self, chrome_timestamp: int) -> datetime:
         """Convert Chrome timestamp to Python datetime.
 
         Chrome uses microseconds since 1601-01-01.
         """
-        # Chrome timestamp is in microseconds
-        seconds_since_chrome_epoch = chrome_timestamp / 1_000_000
-        return self.CHROME_EPOCH + timedelta(seconds=seconds_since_chrome_epoch)
+        # Integer microseconds: exact, and no float division per row
+        return self.CHROME_EPOCH + timedelta(microseconds=chrome_timestamp)
 
-    def _datetime_to_chrome_timestamp(self, dt: datetime) -> int:
-        """Convert Python datetime to Chrome timestamp."""
-        delta = dt - self.CHROME_EPOCH
-        return int(delta.total_seconds() * 1_000_000)
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _datetime_to_chrome_timestamp(dt: datetime) -> int:
+        """Convert Python datetime to Chrome timestamp.
+
+        Cached, since every profile in a scan converts the same `since`.
+        """
+        return (dt - BrowserHistoryScanner.CHROME_EPOCH) // timedelta(microseconds=1)
 
     def get_recent_history(self, hours: int = 24,
-                          limit: Optional[int] = 100) -> Dict[str, List[Dict]]:
+                          limit: Optional[int] = 100) -> Dict[str, List[HistoryEntry]]:
         """Get recent browsing history across all browsers.
 
         Args:
@@ -210,47 +170,99 @@ class BrowserHistoryScanner:
         since = datetime.now() - timedelta(hours=hours)
         return self.scan_all_profiles(since=since, limit=limit)
 
+    def _read_history_aggregated(self, conn: sqlite3.Connection,
+                                 since: Optional[datetime] = None) -> List[tuple]:
+        """Read one row per URL with visit totals aggregated by SQLite.
+
+        Args:
+            conn: Open connection to the history database
+            since: Only count visits after this time
+
+        Returns:
+            (url, title, visits, first_visit, last_visit) tuples
+        """
+        query = """
+            SELECT
+                urls.url,
+                COALESCE(NULLIF(urls.title, ''), urls.url) AS title,
+                COUNT(*) AS visits,
+                MIN(visits.visit_time) AS first_visit,
+                MAX(visits.visit_time) AS last_visit
+            FROM visits
+            JOIN urls ON urls.id = visits.url
+            WHERE urls.hidden = 0
+        """
+
+        params = []
+
+        if since:
+            query += " AND visits.visit_time >= ?"
+            params.append(self._datetime_to_chrome_timestamp(since))
+
+        query += " GROUP BY urls.url"
+
+        return conn.execute(query, params).fetchall()
+
     def get_unique_urls(self, since: Optional[datetime] = None) -> Dict[str, Dict]:
         """Get unique URLs across all browsers.
 
         Returns a dictionary where keys are URLs and values contain
         aggregated information about that URL from all browsers.
         """
-        all_history = self.scan_all_profiles(since=since)
+        if not self.profiles:
+            self.discover_browsers()
+
         unique_urls = {}
 
-        for profile_name, history_list in all_history.items():
-            for item in history_list:
-                url = item['url']
+        for profile in self.profiles:
+            if not profile.is_valid():
+                logger.warning(f"Invalid profile: {profile}")
+                continue
+
+            try:
+                with open_history_copy(profile.history_db_path) as conn:
+                    rows = self._read_history_aggregated(conn, since)
+            except Exception as e:
+                logger.error(f"Error scanning {profile}: {e}")
+                continue
+
+            profile_label = f"{profile.browser} - {profile.profile_name}"
+
+            # Merge the per-profile aggregates; visit times stay as Chrome
+            # timestamps until the end
+            for url, title, visits, first_visit, last_visit in rows:
+                data = unique_urls.get(url)
 
-                if url not in unique_urls:
+                if data is None:
                     unique_urls[url] = {
                         'url': url,
-                        'title': item['title'],
-                        'first_visited': item['visited_at'],
-                        'last_visited': item['visited_at'],
-                        'total_visits': 0,
-                        'browsers': set(),
-                        'profiles': set()
+                        'title': title,
+                        'first_visited': first_visit,
+                        'last_visited': last_visit,
+                        'total_visits': visits,
+                        'browsers': {profile.browser},
+                        'profiles': {profile_label}
                     }
+                    continue
 
-                # Update aggregated data
-                unique_urls[url]['total_visits'] += 1
-                unique_urls[url]['browsers'].add(item['browser'])
-                unique_urls[url]['profiles'].add(f"{item['browser']} - {item['profile']}")
+                data['total_visits'] += visits
+                data['browsers'].add(profile.browser)
+                data['profiles'].add(profile_label)
 
                 # Update title if current one is better (longer)
-                if len(item['title']) > len(unique_urls[url]['title']):
-                    unique_urls[url]['title'] = item['title']
+                if len(title) > len(data['title']):
+                    data['title'] = title
 
                 # Update visit times
-                if item['visited_at'] < unique_urls[url]['first_visited']:
-                    unique_urls[url]['first_visited'] = item['visited_at']
-                if item['visited_at'] > unique_urls[url]['last_visited']:
-                    unique_urls[url]['last_visited'] = item['visited_at']
+                if first_visit < data['first_visited']:
+                    data['first_visited'] = first_visit
+                if last_visit > data['last_visited']:
+                    data['last_visited'] = last_visit
 
-        # Convert sets to lists for JSON serialization
+        # Convert timestamps, and sets to lists for JSON serialization
         for url_data in unique_urls.values():
+            url_data['first_visited'] = self._chrome_timestamp_to_datetime(url_data['first_visited'])
+            url_data['last_visited'] = self._chrome_timestamp_to_datetime(url_data['last_visited'])
             url_data['browsers'] = list(url_data['browsers'])
             url_data['profiles'] = list(url_data['profiles'])
 
@@ -314,6 +326,12 @@ class HistoryTracker:
             if not profile.is_valid():
                 continue
 
+            # Skip the copy and query if the browser hasn't written since
+            if not history_changed_since(profile.history_db_path, source.last_scanned_at):
+                profile_key = f"{source.browser_name} - {source.profile_name}"
+                stats[profile_key] = {'new': 0, 'updated': 0, 'total': 0}
+                continue
+
             # Scan this profile
             try:
                 # Use last scan time if available, otherwise use since parameter
@@ -321,21 +339,13 @@ class HistoryTracker:
 
                 history = self.scanner.scan_browser_profile(profile, since=scan_since)
 
-                new_count = 0
-                updated_count = 0
-
-                for item in history:
-                    link = self.db_manager.upsert_link(
-                        url=item['url'],
-                        title=item['title'],
-                        browser=item['browser'],
-                        browser_profile=item['profile']
-                    )
-
-                    if link.access_count == 1:
-                        new_count += 1
-                    else:
-                        updated_count += 1
+                # One transaction for the whole profile; visits are
+                # recorded at scan time, as before
+                new_count, updated_count = self.db_manager.upsert_links_batch(
+                    [(item.url, item.title, None) for item in history],
+                    browser=profile.browser,
+                    browser_profile=profile.profile_name
+                )
 
                 # Update scan time
                 self.db_manager.update_browser_scan_time(source.id)
@@ -378,9 +388,9 @@ if __name__ == "__main__":
             for profile_name, history in recent.items():
                 print(f"\n{profile_name}:")
                 for item in history[:5]:  # Show first 5 items
-                    print(f"  - {item['title'][:50]}...")
-                    print(f"    URL: {item['url'][:80]}...")
-                    print(f"    Visited: {item['visited_at']}")
+                    print(f"  - {item.title[:50]}...")
+                    print(f"    URL: {item.url[:80]}...")
+                    print(f"    Visited: {item.visited_at}")
         else:
             print("No recent history found.")
     else:
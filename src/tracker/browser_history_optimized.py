@@ -4,20 +4,54 @@ Performance improvements for faster scanning and loading.
 """
 
 import sqlite3
-import shutil
-import tempfile
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional, Set
 import logging
-from contextlib import contextmanager
+from functools import lru_cache
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from tracker.browser_paths import BrowserProfile, BrowserPathFinder
+from tracker.history_db import HistoryEntry, history_changed_since, open_history_copy
 
 logger = logging.getLogger(__name__)
 
+# Visits newest first; binds the minimum Chrome timestamp (0 for all). Kept
+# constant so SQLite's statement cache can reuse the plan
+RECENT_VISITS_QUERY = """
+    SELECT
+        urls.url,
+        COALESCE(NULLIF(urls.title, ''), urls.url) AS title,
+        urls.visit_count,
+        visits.visit_time as last_visit_time
+    FROM visits
+    JOIN urls ON urls.id = visits.url
+    WHERE urls.hidden = 0 AND visits.visit_time >= ?
+    ORDER BY visits.visit_time DESC
+"""
+
+# Latest visit per URL, most recent first; binds the minimum Chrome
+# timestamp and a LIMIT (-1 for all). Groups every visit, so it is used
+# when no limit or a large one is requested
+RECENT_URLS_QUERY = """
+    SELECT
+        urls.url,
+        COALESCE(NULLIF(urls.title, ''), urls.url) AS title,
+        urls.visit_count,
+        MAX(visits.visit_time) as last_visit_time
+    FROM visits
+    JOIN urls ON urls.id = visits.url
+    WHERE urls.hidden = 0 AND visits.visit_time >= ?
+    GROUP BY urls.url
+    ORDER BY last_visit_time DESC
+    LIMIT ?
+"""
+
+# Limits up to this use the newest-first visit walk, which stops early but
+# handles one Python row per visit; larger limits use RECENT_URLS_QUERY
+WALK_MAX_LIMIT = 5000
+
 # Get local timezone offset
 def _get_local_tz_offset_hours() -> float:
     """Get local timezone offset from UTC in hours."""
@@ -41,8 +75,9 @@ class OptimizedBrowserHistoryScanner:
         self.profiles = []
         # Thread pool for parallel scanning
         self.executor = ThreadPoolExecutor(max_workers=4)
-        # Instance-level cache (not class-level) to prevent memory leak
-        self._url_cache: Set[str] = set()
+        # Instance-level cache (not class-level) to prevent memory leak;
+        # holds hash(url) values rather than the URL strings
+        self._url_cache: Set[int] = set()
         self._cache_lock = threading.Lock()
 
     def discover_browsers(self) -> List[BrowserProfile]:
@@ -52,7 +87,7 @@ class OptimizedBrowserHistoryScanner:
 
     def scan_browser_profile(self, profile: BrowserProfile,
                            since: Optional[datetime] = None,
-                           limit: Optional[int] = 1000) -> List[Dict]:
+                           limit: Optional[int] = 1000) -> List[HistoryEntry]:
         """Scan a specific browser profile's history with optimizations.
 
         Args:
@@ -61,118 +96,90 @@ class OptimizedBrowserHistoryScanner:
             limit: Maximum number of results (default 1000 for performance)
 
         Returns:
-            List of dictionaries with URL data
+            List of HistoryEntry records
         """
         if not profile.is_valid():
             logger.warning(f"Invalid profile: {profile}")
             return []
 
         # Copy the database to avoid locking issues
-        with self._get_temp_db_copy(profile.history_db_path) as temp_db_path:
-            return self._read_history_db_optimized(temp_db_path, profile, since, limit)
-
-    @contextmanager
-    def _get_temp_db_copy(self, db_path: Path):
-        """Create a temporary copy of the database to avoid lock issues."""
-        temp_file = None
-        try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tf:
-                temp_file = Path(tf.name)
+        with open_history_copy(profile.history_db_path) as conn:
+            return self._read_history_db_optimized(conn, profile, since, limit)
 
-            # Copy the database
-            shutil.copy2(db_path, temp_file)
-            yield temp_file
-
-        finally:
-            # Clean up temporary file
-            if temp_file and temp_file.exists():
-                try:
-                    temp_file.unlink()
-                except Exception as e:
-                    logger.warning(f"Could not delete temp file {temp_file}: {e}")
-
-    def _read_history_db_optimized(self, db_path: Path, profile: BrowserProfile,
+    def _read_history_db_optimized(self, conn: sqlite3.Connection, profile: BrowserProfile,
                                   since: Optional[datetime] = None,
-                                  limit: Optional[int] = 1000) -> List[Dict]:
+                                  limit: Optional[int] = 1000) -> List[HistoryEntry]:
         """Optimized database reading with better performance.
 
         Args:
-            db_path: Path to the database file
+            conn: Open connection to the history database
             profile: BrowserProfile information
             since: Only get URLs visited after this time
             limit: Maximum number of results
 
         Returns:
-            List of dictionaries with URL data
+            List of HistoryEntry records
         """
-        conn = sqlite3.connect(str(db_path))
-        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
         try:
-            # Optimized query - get only essential data
-            # Use index on visit_time for faster filtering
-            query = """
-                SELECT DISTINCT
-                    urls.url,
-                    urls.title,
-                    urls.visit_count,
-                    MAX(visits.visit_time) as last_visit_time
-                FROM urls
-                JOIN visits ON urls.id = visits.url
-            """
-
-            params = []
-
-            # Add time filter if specified
-            if since:
-                # Convert datetime to Chrome timestamp
-                chrome_timestamp = self._datetime_to_chrome_timestamp(since)
-                query += " WHERE visits.visit_time >= ?"
-                params.append(chrome_timestamp)
-
-            # Group by URL for better performance
-            query += " GROUP BY urls.url"
-
-            # Order by most recent first
-            query += " ORDER BY last_visit_time DESC"
-
-            # Add limit for performance
-            if limit:
-                query += " LIMIT ?"
-                params.append(limit)
-
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-
-            # Convert to list of dictionaries with caching
-            results = []
+            since_timestamp = self._datetime_to_chrome_timestamp(since) if since else 0
+
+            # Rows are (url, title, visit_count, visit_time) tuples
+            if limit and limit <= WALK_MAX_LIMIT:
+                # Walk visits newest first along visits_time_index. The first
+                # visit seen for a URL is its latest, so the walk can stop after
+                # `limit` distinct URLs instead of grouping and sorting them all
+                cursor.execute(RECENT_VISITS_QUERY, (since_timestamp,))
+                latest = {}
+                for row in cursor:
+                    url = row[0]
+                    if url not in latest:
+                        latest[url] = row
+                        if len(latest) >= limit:
+                            break
+                rows = latest.values()
+            else:
+                # Whole history or a large part of it: let SQLite group by URL
+                cursor.execute(RECENT_URLS_QUERY, (since_timestamp, limit or -1))
+                rows = cursor.fetchall()
+
+            # Hash outside the lock; the cache keeps only the 64-bit hashes
+            # so it does not hold on to every scanned URL string
+            keyed = [(hash(row[0]), row) for row in rows]
+
             with self._cache_lock:
                 # Clear cache if it's getting too large (prevents memory leak)
                 if len(self._url_cache) > self.MAX_CACHE_SIZE:
                     self._url_cache.clear()
                     logger.info("URL cache cleared due to size limit")
-                
-                for row in rows:
-                    url = row['url']
 
-                    # Skip if already in cache (for current session)
-                    if url in self._url_cache:
-                        continue
+                # Skip if already in cache (for current session)
+                new_rows = []
+                for url_hash, row in keyed:
+                    if url_hash not in self._url_cache:
+                        self._url_cache.add(url_hash)
+                        new_rows.append(row)
 
-                    self._url_cache.add(url)
+            # Convert to HistoryEntry records
+            # Local-time epoch, so each row needs one integer timedelta only
+            local_epoch = self._local_chrome_epoch()
 
-                    visited_at = self._chrome_timestamp_to_datetime(row['last_visit_time'])
+            # Same for every row; each record shares these two strings
+            browser = profile.browser
+            profile_name = profile.profile_name
+            to_datetime = self._chrome_timestamp_to_datetime
 
-                    results.append({
-                        'url': url,
-                        'title': row['title'] or url,
-                        'visit_count': row['visit_count'],
-                        'visited_at': visited_at,
-                        'browser': profile.browser,
-                        'profile': profile.profile_name
-                    })
+            results = []
+            for url, title, visit_count, visit_time in new_rows:
+                results.append(HistoryEntry(
+                    url,
+                    title,
+                    visit_count,
+                    to_datetime(visit_time, local_epoch),
+                    browser,
+                    profile_name
+                ))
 
             return results
 
@@ -180,32 +187,42 @@ class OptimizedBrowserHistoryScanner:
             logger.error(f"Error reading history database: {e}")
             return []
 
-        finally:
-            conn.close()
+    def _local_chrome_epoch(self) -> datetime:
+        """Get the Chrome epoch shifted to local time.
 
-    def _chrome_timestamp_to_datetime(self, chrome_timestamp: int) -> datetime:
+        Uses system timezone instead of hardcoded offset. The offset is
+        rounded to whole minutes, dropping the jitter between the two now() calls.
+        """
+        offset_minutes = round(_get_local_tz_offset_hours() * 60)
+        return self.CHROME_EPOCH + timedelta(minutes=offset_minutes)
+
+    def _chrome_timestamp_to_datetime(self, chrome_timestamp: int,
+                                      local_epoch: Optional[datetime] = None) -> datetime:
         """Convert Chrome timestamp to Python datetime in local timezone.
 
         Chrome stores timestamps in UTC, but we need to display them in local time.
-        Uses system timezone instead of hardcoded offset.
+
+        Args:
+            chrome_timestamp: Microseconds since 1601-01-01 UTC
+            local_epoch: Result of _local_chrome_epoch(), to reuse across rows
         """
-        # Chrome timestamp is in microseconds
-        seconds_since_chrome_epoch = chrome_timestamp / 1_000_000
-        utc_time = self.CHROME_EPOCH + timedelta(seconds=seconds_since_chrome_epoch)
+        if local_epoch is None:
+            local_epoch = self._local_chrome_epoch()
 
-        # Convert UTC to local time using system timezone
-        local_offset_hours = _get_local_tz_offset_hours()
-        local_time = utc_time + timedelta(hours=local_offset_hours)
+        # Integer microseconds: exact, and no float division per row
+        return local_epoch + timedelta(microseconds=chrome_timestamp)
 
-        return local_time
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _datetime_to_chrome_timestamp(dt: datetime) -> int:
+        """Convert Python datetime to Chrome timestamp.
 
-    def _datetime_to_chrome_timestamp(self, dt: datetime) -> int:
-        """Convert Python datetime to Chrome timestamp."""
-        delta = dt - self.CHROME_EPOCH
-        return int(delta.total_seconds() * 1_000_000)
+        Cached, since every profile in a scan converts the same `since`.
+        """
+        return (dt - OptimizedBrowserHistoryScanner.CHROME_EPOCH) // timedelta(microseconds=1)
 
     def scan_all_profiles_parallel(self, since: Optional[datetime] = None,
-                                  limit: Optional[int] = 500) -> Dict[str, List[Dict]]:
+                                  limit: Optional[int] = 500) -> Dict[str, List[HistoryEntry]]:
         """Scan all profiles in parallel for better performance.
 
         Args:
@@ -243,7 +260,7 @@ class OptimizedBrowserHistoryScanner:
         return results
 
     def get_recent_history(self, hours: int = 24,
-                          limit: Optional[int] = 100) -> Dict[str, List[Dict]]:
+                          limit: Optional[int] = 100) -> Dict[str, List[HistoryEntry]]:
         """Get recent browsing history with optimizations."""
         since = datetime.now() - timedelta(hours=hours)
         return self.scan_all_profiles_parallel(since=since, limit=limit)
@@ -301,7 +318,13 @@ class OptimizedHistoryTracker:
             # Get all browser sources from database
             sources = self.db_manager.get_browser_sources(active_only=True)
 
-            # Process each source
+            # Always use the since parameter to avoid missing URLs
+            # that were visited before the last scan time
+            scan_since = since
+
+            # Start copying and reading every profile on the scanner's pool,
+            # so the next profiles are read while earlier ones are stored
+            futures = {}
             for source in sources:
                 profile_path = Path(source.profile_path)
                 profile = BrowserProfile(
@@ -313,17 +336,26 @@ class OptimizedHistoryTracker:
                 if not profile.is_valid():
                     continue
 
-                try:
-                    # Always use the since parameter to avoid missing URLs
-                    # that were visited before the last scan time
-                    scan_since = since
+                # Skip the copy and query if the browser hasn't written since
+                if not history_changed_since(profile.history_db_path, source.last_scanned_at):
+                    profile_key = f"{source.browser_name} - {source.profile_name}"
+                    stats[profile_key] = {'new': 0, 'updated': 0, 'filtered': 0, 'total': 0}
+                    continue
+
+                # Scan with limit for performance
+                future = self.scanner.executor.submit(
+                    self.scanner.scan_browser_profile,
+                    profile,
+                    since=scan_since,
+                    limit=max_items
+                )
+                futures[future] = (source, profile)
 
-                    # Scan with limit for performance
-                    history = self.scanner.scan_browser_profile(
-                        profile,
-                        since=scan_since,
-                        limit=max_items
-                    )
+            # Store each profile's links as soon as its read finishes
+            for future in as_completed(futures):
+                source, profile = futures[future]
+                try:
+                    history = future.result()
 
                     if history:
                         # Batch insert/update for better performance
@@ -352,40 +384,24 @@ class OptimizedHistoryTracker:
 
             return stats
 
-    def _batch_update_links(self, history_items: List[Dict],
+    def _batch_update_links(self, history_items: List[HistoryEntry],
                           browser: str, browser_profile: str) -> tuple:
         """Batch update links for better performance.
 
         Returns:
             Tuple of (new_count, updated_count, filtered_count)
         """
-        new_count = 0
-        updated_count = 0
-        filtered_count = 0
-
-        # Process in smaller batches to avoid memory issues
-        batch_size = 50
-        for i in range(0, len(history_items), batch_size):
-            batch = history_items[i:i + batch_size]
-
-            for item in batch:
-                # Check if URL should be tracked (not filtered)
-                if not self.db_manager.should_track_url(item['url']):
-                    filtered_count += 1
-                    continue  # Skip filtered URLs
-
-                link = self.db_manager.upsert_link(
-                    url=item['url'],
-                    title=item['title'],
-                    browser=browser,
-                    browser_profile=browser_profile,
-                    visited_at=item.get('visited_at')  # Pass the actual visit time
-                )
-
-                if link.access_count == 1:
-                    new_count += 1
-                else:
-                    updated_count += 1
+        # Check if URLs should be tracked (not filtered)
+        tracked = [item for item in history_items
+                   if self.db_manager.should_track_url(item.url)]
+        filtered_count = len(history_items) - len(tracked)
+
+        # One transaction for the whole profile
+        new_count, updated_count = self.db_manager.upsert_links_batch(
+            [(item.url, item.title, item.visited_at) for item in tracked],
+            browser=browser,
+            browser_profile=browser_profile
+        )
 
         return new_count, updated_count, filtered_count
 
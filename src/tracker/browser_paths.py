@@ -4,13 +4,87 @@ Finds Chrome/Edge profile locations on Windows.
 """
 
 import os
+import sys
 from pathlib import Path
 from typing import List, Dict, Optional
+import codecs
 import json
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# Start of a "profile" object in a Chromium "Local State" file
+PROFILE_OBJECT_RE = re.compile(rb'"profile"\s*:\s*(?=\{)')
+
+# Bytes decoded at a time while looking for the end of a JSON object
+DECODE_CHUNK_SIZE = 64 * 1024
+
+
+def _decode_json_at(data: bytes, start: int):
+    """Decode the JSON value at data[start:] without decoding the rest of the file.
+
+    The bytes are UTF-8 decoded in growing chunks until the value parses.
+
+    Args:
+        data: Raw JSON document
+        start: Offset of the value
+
+    Returns:
+        The decoded value
+
+    Raises:
+        json.JSONDecodeError, UnicodeDecodeError: If the value is invalid
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    text = ''
+    pos = start
+    size = DECODE_CHUNK_SIZE
+    while True:
+        final = pos + size >= len(data)
+        text += decoder.decode(data[pos:pos + size], final)
+        pos += size
+        try:
+            return json.JSONDecoder().raw_decode(text)[0]
+        except json.JSONDecodeError:
+            if final:
+                raise
+            size *= 2  # Value is longer than what was decoded so far
+
+
+def _is_info_cache(value) -> bool:
+    """Check that a value looks like profile.info_cache (dicts keyed by profile)."""
+    return isinstance(value, dict) and all(isinstance(info, dict) for info in value.values())
+
+
+def _read_profile_info_cache(local_state_path: Path) -> dict:
+    """Read profile.info_cache from a Chromium "Local State" file.
+
+    The file can be several MB (variations seed, metrics), so only the
+    "profile" object is decoded; the full document is parsed only if no
+    "profile" object with a valid info_cache is found.
+
+    Args:
+        local_state_path: Path to the "Local State" file
+
+    Returns:
+        Mapping of profile directory name to profile metadata
+    """
+    with open(local_state_path, 'rb') as f:
+        data = f.read()
+
+    for match in PROFILE_OBJECT_RE.finditer(data):
+        try:
+            profile = _decode_json_at(data, match.end())
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            break  # Fall back to the full parse
+        info_cache = profile.get('info_cache')
+        if _is_info_cache(info_cache):
+            return info_cache
+
+    local_state = json.loads(data)
+    return local_state.get('profile', {}).get('info_cache', {})
+
 
 class BrowserProfile:
     """Represents a browser profile with its path and metadata."""
@@ -31,32 +105,50 @@ class BrowserProfile:
         return self.history_db_path.exists()
 
 
+def _app_data_paths(*candidates) -> List[Path]:
+    """Build paths under Windows app data folders.
+
+    Args:
+        candidates: (environment variable, relative path) pairs
+
+    Returns:
+        Paths whose environment variable is set; unset ones are skipped
+        rather than turned into bogus root-relative paths
+    """
+    paths = []
+    for env_var, relative_path in candidates:
+        base = os.environ.get(env_var)
+        if base:
+            paths.append(Path(base) / relative_path)
+    return paths
+
+
 class BrowserPathFinder:
     """Finds browser profile paths on the system."""
 
-    # Default paths for browser data on Windows
+    # Default paths for browser data on Windows (none elsewhere)
     BROWSER_PATHS = {
-        'Chrome': [
-            Path(os.environ.get('LOCALAPPDATA', '')) / 'Google' / 'Chrome' / 'User Data',
-            Path(os.environ.get('APPDATA', '')) / 'Google' / 'Chrome' / 'User Data',
-        ],
-        'Edge': [
-            Path(os.environ.get('LOCALAPPDATA', '')) / 'Microsoft' / 'Edge' / 'User Data',
-            Path(os.environ.get('APPDATA', '')) / 'Microsoft' / 'Edge' / 'User Data',
-        ],
-        'Brave': [
-            Path(os.environ.get('LOCALAPPDATA', '')) / 'BraveSoftware' / 'Brave-Browser' / 'User Data',
-            Path(os.environ.get('APPDATA', '')) / 'BraveSoftware' / 'Brave-Browser' / 'User Data',
-        ],
-        'Opera': [
-            Path(os.environ.get('APPDATA', '')) / 'Opera Software' / 'Opera Stable',
-            Path(os.environ.get('APPDATA', '')) / 'Opera Software' / 'Opera GX Stable',
-        ],
-        'Vivaldi': [
-            Path(os.environ.get('LOCALAPPDATA', '')) / 'Vivaldi' / 'User Data',
-            Path(os.environ.get('APPDATA', '')) / 'Vivaldi' / 'User Data',
-        ]
-    }
+        'Chrome': _app_data_paths(
+            ('LOCALAPPDATA', 'Google/Chrome/User Data'),
+            ('APPDATA', 'Google/Chrome/User Data'),
+        ),
+        'Edge': _app_data_paths(
+            ('LOCALAPPDATA', 'Microsoft/Edge/User Data'),
+            ('APPDATA', 'Microsoft/Edge/User Data'),
+        ),
+        'Brave': _app_data_paths(
+            ('LOCALAPPDATA', 'BraveSoftware/Brave-Browser/User Data'),
+            ('APPDATA', 'BraveSoftware/Brave-Browser/User Data'),
+        ),
+        'Opera': _app_data_paths(
+            ('APPDATA', 'Opera Software/Opera Stable'),
+            ('APPDATA', 'Opera Software/Opera GX Stable'),
+        ),
+        'Vivaldi': _app_data_paths(
+            ('LOCALAPPDATA', 'Vivaldi/User Data'),
+            ('APPDATA', 'Vivaldi/User Data'),
+        )
+    } if sys.platform == 'win32' else {}
 
     @classmethod
     def find_browser_profiles(cls, browser_name: Optional[str] = None) -> List[BrowserProfile]:
@@ -77,43 +169,53 @@ class BrowserPathFinder:
         else:
             browsers_to_check = cls.BROWSER_PATHS
 
-        for browser, paths in browsers_to_check.items():
-            for base_path in paths:
-                if not base_path.exists():
-                    continue
+        if not browsers_to_check:
+            logger.debug("No browser data directories to check on this system")
+            return profiles
 
-                # Find profiles in this browser's data directory
-                found_profiles = cls._find_profiles_in_directory(browser, base_path)
-                profiles.extend(found_profiles)
-                if found_profiles:
-                    break  # Found profiles for this browser, skip other paths
+        for browser, paths in browsers_to_check.items():
+            profiles.extend(cls._find_profiles_in_browser(browser, paths))
 
         return profiles
 
+    @classmethod
+    def _find_profiles_in_browser(cls, browser: str, paths: List[Path]) -> List[BrowserProfile]:
+        """Find a browser's profiles in the first data directory that has any."""
+        for base_path in paths:
+            # Find profiles in this browser's data directory
+            found_profiles = cls._find_profiles_in_directory(browser, base_path)
+            if found_profiles:
+                return found_profiles  # Skip other paths
+
+        return []
+
     @classmethod
     def _find_profiles_in_directory(cls, browser: str, user_data_path: Path) -> List[BrowserProfile]:
         """Find all profiles in a browser's user data directory."""
         profiles = []
 
-        if not user_data_path.exists():
-            return profiles
+        # List the directory once; the entries carry their file type, so no
+        # separate exists()/is_dir() calls are needed below
+        try:
+            with os.scandir(user_data_path) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            return profiles  # Missing or unreadable
 
         # Read the Local State file to get profile info
         local_state_path = user_data_path / "Local State"
         profile_info = {}
 
-        if local_state_path.exists():
+        if "Local State" in entries:
             try:
-                with open(local_state_path, 'r', encoding='utf-8') as f:
-                    local_state = json.load(f)
-                    if 'profile' in local_state and 'info_cache' in local_state['profile']:
-                        profile_info = local_state['profile']['info_cache']
-            except (json.JSONDecodeError, IOError) as e:
+                profile_info = _read_profile_info_cache(local_state_path)
+            except (json.JSONDecodeError, UnicodeDecodeError, IOError) as e:
                 logger.warning(f"Could not read Local State file: {e}")
 
         # Check Default profile
-        default_profile_path = user_data_path / "Default"
-        if default_profile_path.exists():
+        default_entry = entries.get("Default")
+        if default_entry is not None and default_entry.is_dir():
+            default_profile_path = Path(default_entry.path)
             profile_name = profile_info.get('Default', {}).get('name', 'Default')
             profiles.append(BrowserProfile(
                 browser=browser,
@@ -123,21 +225,19 @@ class BrowserPathFinder:
             ))
 
         # Check numbered profiles (Profile 1, Profile 2, etc.)
-        for profile_dir in user_data_path.glob("Profile *"):
-            if profile_dir.is_dir():
-                profile_key = profile_dir.name
+        for profile_key, entry in entries.items():
+            if profile_key.startswith("Profile ") and entry.is_dir():
                 profile_display_name = profile_info.get(profile_key, {}).get('name', profile_key)
                 profiles.append(BrowserProfile(
                     browser=browser,
                     profile_name=profile_display_name,
-                    profile_path=profile_dir,
+                    profile_path=Path(entry.path),
                     is_default=False
                 ))
 
         # For Opera and some other browsers, the main directory itself might be the profile
         if not profiles and browser in ['Opera']:
-            history_path = user_data_path / "History"
-            if history_path.exists():
+            if "History" in entries:
                 profiles.append(BrowserProfile(
                     browser=browser,
                     profile_name="Default",
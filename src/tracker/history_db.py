@@ -0,0 +1,119 @@
+"""
+SQLite helpers for reading browser history databases.
+"""
+
+import logging
+import shutil
+import sqlite3
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class HistoryEntry(NamedTuple):
+    """One URL read from a browser history database."""
+    url: str
+    title: str
+    visit_count: int
+    visited_at: datetime
+    browser: str
+    profile: str
+
+
+# Tuning for one-off reads of a private history copy. Journal, sync and
+# locking settings are not needed: the connection is read-only and immutable.
+READONLY_PRAGMAS = """
+    PRAGMA query_only = 1;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -65536;
+    PRAGMA mmap_size = 268435456;
+"""
+
+
+def open_readonly(db_path: Path) -> sqlite3.Connection:
+    """Open a copied history database for fast read-only scanning.
+
+    The file is opened as immutable, so SQLite skips locking and never
+    creates journal, -wal or -shm files next to it.
+
+    Args:
+        db_path: Path to the database copy
+
+    Returns:
+        Read-only connection returning plain tuples, for positional unpacking
+    """
+    uri = f"{Path(db_path).resolve().as_uri()}?mode=ro&immutable=1"
+    conn = sqlite3.connect(uri, uri=True)
+    conn.executescript(READONLY_PRAGMAS)
+    return conn
+
+
+def history_changed_since(db_path: Path, since: Optional[datetime]) -> bool:
+    """Check whether a history database may have been written after a time.
+
+    Also looks at the -wal and -journal files, since a browser's latest
+    writes can sit there before reaching the main file.
+
+    Args:
+        db_path: Path to the original database
+        since: Time of the last scan, or None if never scanned
+
+    Returns:
+        False only if no file was modified after `since`
+    """
+    if since is None:
+        return True
+
+    try:
+        mtime = max(
+            path.stat().st_mtime
+            for path in (db_path,
+                         db_path.with_name(db_path.name + '-wal'),
+                         db_path.with_name(db_path.name + '-journal'))
+            if path.exists()
+        )
+    except (OSError, ValueError):
+        return True  # Can't tell, so scan
+
+    return datetime.fromtimestamp(mtime) > since
+
+
+@contextmanager
+def open_history_copy(db_path: Path) -> Iterator[sqlite3.Connection]:
+    """Copy a history database and open the copy with open_readonly().
+
+    Browsers keep their History file exclusively locked while running, so
+    neither a direct read nor SQLite's backup API can be used on it.
+
+    Args:
+        db_path: Path to the original database
+
+    Yields:
+        Read-only connection to the temporary copy
+    """
+    temp_file = None
+    conn = None
+    try:
+        # Create temporary file
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tf:
+            temp_file = Path(tf.name)
+
+        # Copy only the contents; timestamps and permissions are not needed
+        shutil.copyfile(db_path, temp_file)
+        conn = open_readonly(temp_file)
+        yield conn
+
+    finally:
+        if conn is not None:
+            conn.close()
+
+        # Clean up temporary file
+        if temp_file and temp_file.exists():
+            try:
+                temp_file.unlink()
+            except Exception as e:
+                logger.warning(f"Could not delete temp file {temp_file}: {e}")
@@ -1,8 +1,8 @@
 """Browser utility functions for Browser Link Tracker."""
 
 import os
+import shutil
 import subprocess
-import webbrowser
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import logging
@@ -84,18 +84,25 @@ class BrowserManager:
         },
     }
 
-    def __init__(self):
-        """Initialize browser manager."""
-        self._detected_browsers = None
+    # Detection result shared by all instances (installed browsers rarely change)
+    _detected_browsers = None
+
+    @classmethod
+    def invalidate(cls):
+        """Forget detected browsers so the next lookup probes the system again."""
+        cls._detected_browsers = None
 
     def detect_installed_browsers(self) -> Dict[str, str]:
         """Detect installed browsers on the system.
 
+        The result is cached on the class, so only the first call in the
+        process touches the filesystem/registry.
+
         Returns:
             Dictionary mapping browser ID to display name and executable path
         """
-        if self._detected_browsers is not None:
-            return self._detected_browsers
+        if BrowserManager._detected_browsers is not None:
+            return BrowserManager._detected_browsers
 
         browsers = {}
         system = os.name
@@ -116,7 +123,7 @@ class BrowserManager:
             'path': None
         }
 
-        self._detected_browsers = browsers
+        BrowserManager._detected_browsers = browsers
         return browsers
 
     def _find_browser_executable(self, browser_id: str, config: Dict, system: str) -> Optional[str]:
@@ -131,16 +138,23 @@ class BrowserManager:
             Path to browser executable or None
         """
         if system == 'nt':  # Windows
-            # First, try direct file paths
+            # First, try direct file paths; each parent directory is listed
+            # once, however many candidates point into it
+            listings = {}
             for path_template in config.get('windows_paths', []):
                 path = os.path.expandvars(path_template)
-                if os.path.isfile(path):
+                parent, name = os.path.split(path)
+                files = listings.get(parent.lower())
+                if files is None:
+                    files = listings[parent.lower()] = self._list_files(parent)
+                if name.lower() in files:
                     return path
 
             # Second, try registry lookup
             for registry_key in config.get('registry_keys', []):
+                # Already checked to exist by the registry lookup
                 exe_path = self._get_browser_from_registry(registry_key)
-                if exe_path and os.path.isfile(exe_path):
+                if exe_path:
                     return exe_path
         elif system == 'posix':
             # Try Mac paths
@@ -154,6 +168,21 @@ class BrowserManager:
 
         return None
 
+    def _list_files(self, directory: str) -> set:
+        """List the file names in a directory, lowercased.
+
+        Args:
+            directory: Directory to list
+
+        Returns:
+            Set of file names, empty if the directory can't be read
+        """
+        try:
+            with os.scandir(directory) as it:
+                return {entry.name.lower() for entry in it if entry.is_file()}
+        except OSError:
+            return set()
+
     def _get_browser_from_registry(self, key_path: str) -> Optional[str]:
         """Get browser path from Windows registry.
 
@@ -190,12 +219,8 @@ class BrowserManager:
         Returns:
             True if command exists
         """
-        try:
-            subprocess.run(['which', command], check=True,
-                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        # Searches PATH in-process instead of spawning `which`
+        return shutil.which(command) is not None
 
     def open_url(self, url: str, browser_id: str = 'system') -> bool:
         """Open URL in specified browser.
@@ -207,6 +232,8 @@ class BrowserManager:
         Returns:
             True if successful
         """
+        import webbrowser  # Only needed once a link is actually opened
+
         try:
             if browser_id == 'system' or browser_id not in self.detect_installed_browsers():
                 # Use system default
@@ -2,13 +2,19 @@
 Application configuration and settings.
 """
 
+import copy
 import os
+import threading
 from pathlib import Path
 import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Delay before changes made with set() are written out; further changes
+# within the window are saved by the same write
+SAVE_DELAY = 0.5  # seconds
+
 
 class AppConfig:
     """Application configuration manager."""
@@ -56,6 +62,16 @@ class AppConfig:
         self.config_path = self._get_config_path()
         self.config = self.load_config()
 
+        # Every value, including nested ones, under its dotted key
+        self._flat = self._flatten(self.config)
+
+        # Pending write scheduled by set()
+        self._dirty = False
+        self._save_timer = None
+        self._lock = threading.Lock()
+        # Serializes file writes, which happen outside _lock
+        self._write_lock = threading.Lock()
+
     def _get_config_path(self) -> Path:
         """Get path to configuration file."""
         if os.environ.get('LINK_TRACKER_DEV'):
@@ -82,49 +98,105 @@ class AppConfig:
 
     def save_config(self):
         """Save current configuration to file."""
-        try:
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=2)
-            logger.info(f"Configuration saved to {self.config_path}")
-        except IOError as e:
-            logger.error(f"Error saving config: {e}")
+        # Writers take turns, and each snapshots only once it is its turn,
+        # so an older snapshot can never overwrite a newer one
+        with self._write_lock:
+            with self._lock:
+                self._cancel_save_timer()
+                self._dirty = False
+                # Serialize a snapshot; the delayed save runs on a timer thread
+                # while set() may be changing the live config
+                snapshot = copy.deepcopy(self.config)
+
+            # Write a temp file and swap it in, so a crash mid-write
+            # never leaves a truncated config file behind
+            tmp_path = self.config_path.with_suffix('.json.tmp')
+            try:
+                with open(tmp_path, 'w') as f:
+                    json.dump(snapshot, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.config_path)
+                logger.info(f"Configuration saved to {self.config_path}")
+            except (OSError, TypeError, ValueError) as e:
+                logger.error(f"Error saving config: {e}")
+                try:
+                    tmp_path.unlink(missing_ok=True)
+                except OSError:
+                    pass
+
+    def flush(self):
+        """Write pending changes from set() now (call before exiting)."""
+        if self._dirty:
+            self.save_config()
+
+    def _schedule_save(self):
+        """Mark the config dirty and (re)start the delayed save."""
+        with self._lock:
+            self._dirty = True
+            self._cancel_save_timer()
+            self._save_timer = threading.Timer(SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _cancel_save_timer(self):
+        """Cancel the delayed save, if any. Caller must hold _lock."""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
 
     def _merge_configs(self, base: dict, override: dict) -> dict:
-        """Recursively merge configuration dictionaries."""
-        for key, value in override.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                base[key] = self._merge_configs(base[key], value)
-            else:
-                base[key] = value
+        """Deep-merge configuration dictionaries (iteratively, no recursion)."""
+        stack = [(base, override)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    # Merge into a copy so nested DEFAULTS dicts are never modified
+                    current = target[key] = dict(current)
+                    stack.append((current, value))
+                else:
+                    target[key] = value
         return base
 
     def get(self, key: str, default=None):
         """Get configuration value by key (supports dot notation)."""
-        keys = key.split('.')
-        value = self.config
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-
-        return value
+        return self._flat.get(key, default)
+
+    @staticmethod
+    def _flatten(config: dict) -> dict:
+        """Map dotted keys ('column_widths.title') to their values."""
+        flat = {}
+        stack = [('', config)]
+        while stack:
+            prefix, source = stack.pop()
+            for key, value in source.items():
+                path = f"{prefix}{key}"
+                flat[path] = value
+                if isinstance(value, dict):
+                    stack.append((f"{path}.", value))
+        return flat
 
     def set(self, key: str, value):
         """Set configuration value by key (supports dot notation)."""
         keys = key.split('.')
-        config = self.config
-
-        # Navigate to the parent of the target key
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
 
-        # Set the value
-        config[keys[-1]] = value
-        self.save_config()
+        # Change the config under the lock, so a pending save never
+        # snapshots it half-updated
+        with self._lock:
+            config = self.config
+
+            # Navigate to the parent of the target key
+            for k in keys[:-1]:
+                if k not in config:
+                    config[k] = {}
+                config = config[k]
+
+            # Set the value; consecutive changes are saved together
+            config[keys[-1]] = value
+            self._flat = self._flatten(self.config)
+        self._schedule_save()
 
     @property
     def scan_interval(self) -> int:
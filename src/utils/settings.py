@@ -66,13 +66,23 @@ class SettingsManager:
         Returns:
             True if successful, False otherwise.
         """
+        # Write a temp file and swap it in, so a crash mid-write
+        # never leaves a truncated settings file behind
+        tmp_file = self.settings_file.with_suffix('.json.tmp')
         try:
             self.settings_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
                 json.dump(self.settings, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.settings_file)
             return True
-        except IOError as e:
+        except (OSError, TypeError, ValueError) as e:
             logger.error(f"Could not save settings: {e}")
+            try:
+                tmp_file.unlink(missing_ok=True)
+            except OSError:
+                pass
             return False
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -96,6 +106,14 @@ class SettingsManager:
         """
         self.settings[key] = value
 
+    def update(self, values: Dict[str, Any]) -> None:
+        """Set several setting values at once.
+
+        Args:
+            values: Dictionary of setting keys and values
+        """
+        self.settings.update(values)
+
     def reset(self) -> None:
         """Reset all settings to defaults."""
         self.settings = self.DEFAULT_SETTINGS.copy()
@@ -3,9 +3,57 @@ URL utilities for normalization and processing.
 """
 
 from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
+from functools import lru_cache
 import re
 
-
+# Results remembered per function; scans see the same URLs over and over
+URL_CACHE_SIZE = 4096
+
+# Common tracking parameters to remove (built once, not per call)
+TRACKING_PARAMS = frozenset({
+    # UTM and marketing parameters
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'utm_id', 'utm_cid', 'utm_reader', 'utm_name', 'utm_brand',
+    # Ad platform click IDs
+    'fbclid', 'gclid', 'gclsrc', 'dclid', 'msclkid', 'twclid', 'li_fat_id',
+    'ttclid', 'igshid', 'epik', 'pp', 'si',
+    # Analytics
+    '_ga', '_gid', '_gac', '_gl', '_x_tr_sl', '_x_tr_tl', '_x_tr_hl',
+    'ga_source', 'ga_medium', 'ga_term', 'ga_content', 'ga_campaign',
+    # Referral tracking
+    'ref', 'ref_', 'referer', 'referrer', 'source', 'src',
+    # Email marketing
+    'mc_cid', 'mc_eid', 'mkt_tok', 'trk', 'trkEmail', 'trkInfo',
+    # Session and temporary IDs
+    'session', 'sessionid', 'sid', 'ssid', 'phpsessid', 'jsessionid',
+    'token', 'auth', 'authtoken', 'access_token',
+    '_t', '_ts', '_', 'timestamp', 'ts', 'time', 'nocache', 'cache',
+    'rand', 'random', 'rnd', 'cb', 'cachebuster',
+    # Social sharing
+    'share', 'shared', 'via', 'from', 'origin',
+    # Misc tracking
+    'cid', 'eid', 'pid', 'uid', 'aid', 'campaign_id',
+    'tracking', 'track', 'trk', 'affiliate', 'aff', 'partner',
+    'clickid', 'click_id', 'adid', 'ad_id',
+    # Korean sites common params
+    'srsltid', 'gs_lcp', 'sclient', 'ei', 'ved', 'uact', 'oq', 'bih', 'biw',
+    'rlz', 'sxsrf', 'sourceid', 'action', 'sca_esv',
+})
+
+# Common page title suffixes, stripped by clean_title()
+TITLE_SUFFIXES = (
+    ' - Google Search',
+    ' - Google 検索',
+    ' - Bing',
+    ' - YouTube',
+    ' | Microsoft Learn',
+    ' | MDN'
+)
+
+TITLE_SUFFIX_RE = re.compile('(?:' + '|'.join(map(re.escape, TITLE_SUFFIXES)) + ')$')
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def normalize_url(url: str, remove_tracking: bool = True) -> str:
     """Normalize a URL for deduplication.
 
@@ -30,10 +78,10 @@ def normalize_url(url: str, remove_tracking: bool = True) -> str:
         netloc = parsed.netloc.lower() if parsed.netloc else ''
 
         # Remove default ports
-        if ':80' in netloc and scheme == 'http':
-            netloc = netloc.replace(':80', '')
-        elif ':443' in netloc and scheme == 'https':
-            netloc = netloc.replace(':443', '')
+        if scheme == 'http' and netloc.endswith(':80'):
+            netloc = netloc[:-3]
+        elif scheme == 'https' and netloc.endswith(':443'):
+            netloc = netloc[:-4]
 
         # Normalize path (remove trailing slash unless it's root)
         path = parsed.path
@@ -42,37 +90,6 @@ def normalize_url(url: str, remove_tracking: bool = True) -> str:
 
         # Process query parameters
         if parsed.query and remove_tracking:
-            # Common tracking parameters to remove
-            tracking_params = {
-                # UTM and marketing parameters
-                'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
-                'utm_id', 'utm_cid', 'utm_reader', 'utm_name', 'utm_brand',
-                # Ad platform click IDs
-                'fbclid', 'gclid', 'gclsrc', 'dclid', 'msclkid', 'twclid', 'li_fat_id',
-                'ttclid', 'igshid', 'epik', 'pp', 'si',
-                # Analytics
-                '_ga', '_gid', '_gac', '_gl', '_x_tr_sl', '_x_tr_tl', '_x_tr_hl',
-                'ga_source', 'ga_medium', 'ga_term', 'ga_content', 'ga_campaign',
-                # Referral tracking
-                'ref', 'ref_', 'referer', 'referrer', 'source', 'src',
-                # Email marketing
-                'mc_cid', 'mc_eid', 'mkt_tok', 'trk', 'trkEmail', 'trkInfo',
-                # Session and temporary IDs
-                'session', 'sessionid', 'sid', 'ssid', 'phpsessid', 'jsessionid',
-                'token', 'auth', 'authtoken', 'access_token',
-                '_t', '_ts', '_', 'timestamp', 'ts', 'time', 'nocache', 'cache',
-                'rand', 'random', 'rnd', 'cb', 'cachebuster',
-                # Social sharing
-                'share', 'shared', 'via', 'from', 'origin',
-                # Misc tracking
-                'cid', 'eid', 'pid', 'uid', 'aid', 'campaign_id',
-                'tracking', 'track', 'trk', 'affiliate', 'aff', 'partner',
-                'clickid', 'click_id', 'adid', 'ad_id',
-                # Korean sites common params
-                'srsltid', 'gs_lcp', 'sclient', 'ei', 'ved', 'uact', 'oq', 'bih', 'biw',
-                'rlz', 'sxsrf', 'sourceid', 'action', 'sca_esv',
-            }
-
             # Parse and filter query parameters
             params = parse_qs(parsed.query, keep_blank_values=True)
             filtered_params = {}
@@ -80,7 +97,7 @@ def normalize_url(url: str, remove_tracking: bool = True) -> str:
             for key, value in params.items():
                 key_lower = key.lower()
                 # Skip if it's a known tracking parameter
-                if key_lower in tracking_params:
+                if key_lower in TRACKING_PARAMS:
                     continue
                 # Skip if it looks like a timestamp (numeric value > 1000000000)
                 if len(value) == 1 and value[0].isdigit():
@@ -116,6 +133,7 @@ def normalize_url(url: str, remove_tracking: bool = True) -> str:
         return url
 
 
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def extract_domain(url: str) -> str:
     """Extract the domain from a URL.
 
@@ -142,6 +160,7 @@ def extract_domain(url: str) -> str:
         return ''
 
 
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def get_favicon_url(url: str) -> str:
     """Get the likely favicon URL for a given URL.
 
@@ -192,6 +211,7 @@ def truncate_url_for_display(url: str, max_length: int = 80) -> str:
         return domain
 
 
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def is_valid_url(url: str) -> bool:
     """Check if a string is a valid URL.
 
@@ -223,22 +243,8 @@ def clean_title(title: str) -> str:
     # Remove excess whitespace
     title = ' '.join(title.split())
 
-    # Remove common suffixes
-    suffixes = [
-        ' - Google Search',
-        ' - Google 検索',
-        ' - Bing',
-        ' - YouTube',
-        ' | Microsoft Learn',
-        ' | MDN'
-    ]
-
-    for suffix in suffixes:
-        if title.endswith(suffix):
-            title = title[:-len(suffix)]
-            break
-
-    return title
+    # Remove common suffixes (at most one)
+    return TITLE_SUFFIX_RE.sub('', title, count=1)
 
 
 if __name__ == "__main__":
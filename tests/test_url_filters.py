@@ -0,0 +1,73 @@
+"""Tests for database.models.URLFilterSet."""
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from database.models import URLFilter, URLFilterSet  # noqa: E402
+
+
+def _first_match(filters, url):
+    """The one-by-one check URLFilterSet replaced."""
+    for url_filter in filters:
+        if url_filter.matches(url):
+            return url_filter
+    return None
+
+
+class URLFilterSetTest(unittest.TestCase):
+    """URLFilterSet must return the first matching filter in list order."""
+
+    def test_overlapping_filters(self):
+        contains = URLFilter(id=1, pattern='example', filter_type='contains')
+        domain = URLFilter(id=2, pattern='example.com', filter_type='domain')
+        url = 'https://www.example.com/page'
+
+        self.assertIs(URLFilterSet([contains, domain]).find_match(url), contains)
+        self.assertIs(URLFilterSet([domain, contains]).find_match(url), domain)
+
+    def test_overlapping_domains_and_prefixes(self):
+        parent = URLFilter(id=1, pattern='example.com', filter_type='domain')
+        child = URLFilter(id=2, pattern='www.example.com', filter_type='domain')
+        prefix = URLFilter(id=3, pattern='https://www.', filter_type='prefix')
+        url = 'https://www.example.com/'
+
+        self.assertIs(URLFilterSet([parent, child, prefix]).find_match(url), parent)
+        self.assertIs(URLFilterSet([prefix, child, parent]).find_match(url), prefix)
+        self.assertIs(URLFilterSet([child, prefix, parent]).find_match(url), child)
+
+    def test_inactive_filters_are_skipped(self):
+        inactive = URLFilter(id=1, pattern='example.com', filter_type='domain', is_active=False)
+        active = URLFilter(id=2, pattern='/page', filter_type='contains')
+        url_filters = URLFilterSet([inactive, active])
+
+        self.assertIs(url_filters.find_match('https://example.com/page'), active)
+        self.assertIsNone(url_filters.find_match('https://example.com/'))
+
+    def test_matches_one_by_one_check(self):
+        patterns = [
+            ('domain', 'example.com'), ('domain', 'www.example.com'), ('domain', 'org'),
+            ('prefix', 'https://'), ('prefix', 'https://www.example'), ('prefix', 'ftp://'),
+            ('contains', 'page'), ('contains', 'example'), ('regex', r'.*\.org/'),
+            ('regex', r'https?://[^/]*test'),
+        ]
+        urls = ['https://www.example.com/page', 'http://example.com/', 'ftp://files.example.org/',
+                'http://test.net/a', 'https://other.org/page', 'http://nothing.io/']
+        rng = random.Random(0)
+
+        for _ in range(200):
+            chosen = rng.sample(patterns, rng.randint(1, len(patterns)))
+            filters = [URLFilter(id=i, pattern=pattern, filter_type=filter_type,
+                                 is_active=rng.random() > 0.2)
+                       for i, (filter_type, pattern) in enumerate(chosen)]
+            url_filters = URLFilterSet(filters)
+            for url in urls:
+                with self.subTest(filters=chosen, url=url):
+                    self.assertIs(url_filters.find_match(url), _first_match(filters, url))
+
+
+if __name__ == '__main__':
+    unittest.main()
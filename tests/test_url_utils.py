@@ -0,0 +1,63 @@
+"""Tests for utils.url_utils."""
+
+import sys
+import unittest
+from pathlib import Path
+from urllib.parse import urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from utils.url_utils import is_valid_url  # noqa: E402
+
+
+def _urlparse_is_valid(url: str) -> bool:
+    """The urlparse-based check is_valid_url replaced."""
+    try:
+        parsed = urlparse(url)
+        return bool(parsed.scheme and parsed.netloc)
+    except ValueError:
+        return False
+
+
+class IsValidUrlTest(unittest.TestCase):
+    """is_valid_url must agree with the urlparse-based check."""
+
+    def assertAgrees(self, url, expected):
+        with self.subTest(url=url):
+            self.assertEqual(is_valid_url(url), expected)
+            self.assertEqual(is_valid_url(url), _urlparse_is_valid(url))
+
+    def test_valid_urls(self):
+        for url in ('http://example.com', 'https://example.com/a?b=c#d',
+                    'ftp://host', 'chrome://settings', 'http://[::1]/',
+                    'x+y.z-w://host'):
+            self.assertAgrees(url, True)
+
+    def test_invalid_urls(self):
+        for url in ('', 'example.com', 'mailto:a@example.com', 'file:///etc/hosts',
+                    'http:///path', 'http://', '//example.com', '1http://example.com',
+                    'javascript:void(0)'):
+            self.assertAgrees(url, False)
+
+    def test_leading_whitespace(self):
+        for url in (' http://x.com', '\thttp://x', '\n https://x.com/', '\x00http://x'):
+            self.assertAgrees(url, True)
+
+    def test_embedded_tabs_and_newlines(self):
+        # urlparse() removes tab, CR and LF anywhere in the URL
+        self.assertAgrees('http:/\t/x', True)
+        self.assertAgrees('ht\ntp://x', True)
+        self.assertAgrees('http://\n', False)
+        self.assertAgrees('http://\r\t/path', False)
+
+    def test_unbalanced_brackets(self):
+        # urlparse() raises ValueError for these
+        self.assertAgrees('http://[::1', False)
+        self.assertAgrees('http://::1]/', False)
+
+    def test_non_string(self):
+        self.assertFalse(is_valid_url(None))
+
+
+if __name__ == '__main__':
+    unittest.main()